@@ -3,15 +3,19 @@ from importlib.metadata import version
 from collatable.collator import Collator, collate
 from collatable.fields import (
     AdjacencyField,
+    EnumeratedSpansField,
     Field,
     IndexField,
     LabelField,
     ListField,
+    MemmapTensorField,
     MetadataField,
+    MultiLabelField,
     ScalarField,
     SequenceField,
     SequenceLabelField,
     SpanField,
+    SparseAdjacencyField,
     TensorField,
     TextField,
 )
@@ -20,15 +24,19 @@ __version__ = version("collatable")
 __all__ = [
     "AdjacencyField",
     "Collator",
+    "EnumeratedSpansField",
     "Field",
     "IndexField",
     "LabelField",
     "ListField",
+    "MemmapTensorField",
     "MetadataField",
+    "MultiLabelField",
     "ScalarField",
     "SequenceField",
     "SequenceLabelField",
     "SpanField",
+    "SparseAdjacencyField",
     "TensorField",
     "TextField",
     "collate",
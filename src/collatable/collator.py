@@ -1,12 +1,137 @@
-from typing import Any, Dict, Mapping, Optional, Sequence, Set
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
-from collatable.fields import Field
+import numpy
+from numpy.typing import DTypeLike
+
+from collatable.fields import (
+    AdjacencyField,
+    EnumeratedSpansField,
+    Field,
+    LabelField,
+    ListField,
+    MappingField,
+    SequenceLabelField,
+    SparseAdjacencyField,
+    TextField,
+)
 from collatable.types import DataArray, INamedTuple
+from collatable.utils import cast_indices, get_index_dtype
 
 
 class Collator:
-    def __init__(self, field_names: Optional[Set[str]] = None) -> None:
+    _INDEX_KEYS: Mapping[type, Tuple[str, ...]] = {
+        TextField: ("token_ids",),
+        SparseAdjacencyField: ("edge_labels",),
+        EnumeratedSpansField: ("labels",),
+    }
+    _INDEX_FIELD_TYPES: Tuple[type, ...] = (
+        LabelField,
+        SequenceLabelField,
+        AdjacencyField,
+    )
+    _MASK_KEYS: Mapping[type, Tuple[str, ...]] = {
+        TextField: ("mask",),
+        EnumeratedSpansField: ("mask",),
+    }
+
+    def __init__(
+        self,
+        field_names: Optional[Set[str]] = None,
+        *,
+        index_dtype: Optional[Union[DTypeLike, Literal["auto"]]] = None,
+        vocab_sizes: Optional[Mapping[str, int]] = None,
+        pack_masks: bool = False,
+    ) -> None:
         self._field_names = field_names
+        if isinstance(index_dtype, str) and index_dtype == "auto":
+            if vocab_sizes is None:
+                raise ValueError('index_dtype="auto" requires vocab_sizes.')
+        elif vocab_sizes is not None:
+            raise ValueError('vocab_sizes is only used with index_dtype="auto".')
+        elif not (index_dtype is None or numpy.issubdtype(index_dtype, numpy.integer)):
+            raise ValueError(f"index_dtype must be an integer dtype, got {index_dtype}")
+        self._index_dtype = index_dtype
+        self._index_dtypes: Dict[str, numpy.dtype] = {
+            name: get_index_dtype(size) for name, size in (vocab_sizes or {}).items()
+        }
+        self._pack_masks = pack_masks
+
+    @property
+    def field_names(self) -> Optional[Set[str]]:
+        return self._field_names
+
+    def postprocess(self, name: str, field: Field, array: DataArray) -> DataArray:
+        dtype = self._get_index_dtype(name)
+        if dtype is not None:
+            array = self._map_arrays(
+                field,
+                array,
+                self._INDEX_KEYS,
+                self._INDEX_FIELD_TYPES,
+                lambda value: self._cast_indices(value, dtype),
+            )
+        if self._pack_masks:
+            array = self._map_arrays(field, array, self._MASK_KEYS, (), self._pack_mask)
+        return array
+
+    def _get_index_dtype(self, name: str) -> Optional[DTypeLike]:
+        if isinstance(self._index_dtype, str) and self._index_dtype == "auto":
+            return self._index_dtypes.get(name)
+        return self._index_dtype
+
+    @staticmethod
+    def _cast_indices(array: Any, dtype: DTypeLike) -> Any:
+        if not isinstance(array, numpy.ndarray) or not numpy.issubdtype(
+            array.dtype, numpy.integer
+        ):
+            return array
+        return cast_indices(array, dtype)
+
+    @staticmethod
+    def _pack_mask(array: Any) -> Any:
+        if isinstance(array, numpy.ndarray) and array.dtype == numpy.bool_:
+            return numpy.packbits(array, axis=-1)
+        return array
+
+    def _map_arrays(
+        self,
+        field: Field,
+        array: DataArray,
+        keys: Mapping[type, Tuple[str, ...]],
+        field_types: Tuple[type, ...],
+        func: Callable[[Any], Any],
+    ) -> DataArray:
+        if isinstance(field, ListField):
+            if len(field) == 0:
+                return array
+            return self._map_arrays(field.fields[0], array, keys, field_types, func)
+        if isinstance(array, Mapping):
+            if isinstance(field, MappingField):
+                return {
+                    key: self._map_arrays(field[key], value, keys, field_types, func)
+                    if key in field
+                    else value
+                    for key, value in array.items()
+                }
+            field_keys = keys.get(type(field), ())
+            return {
+                key: func(value) if key in field_keys else value
+                for key, value in array.items()
+            }
+        if isinstance(field, field_types):
+            return func(array)
+        return array
 
     def _extract_fields(self, instance: Any) -> Mapping[str, Field]:
         if not isinstance(instance, Mapping):
@@ -44,7 +169,7 @@ class Collator:
         array: Dict[str, DataArray] = {}
         for key in keys:
             values = [instance[key] for instance in instances]
-            array[key] = values[0].collate(values)
+            array[key] = self.postprocess(key, values[0], values[0].collate(values))
         return array
 
 
@@ -1,4 +1,10 @@
-from collatable.extras.dataloader import DataLoader, DefaultBatchSampler
+from collatable.extras.aio import AsyncBatchIterator, AsyncDataModule
+from collatable.extras.cache import DataModuleCache
+from collatable.extras.dataloader import (
+    DataLoader,
+    DefaultBatchSampler,
+    StreamingBatchSampler,
+)
 from collatable.extras.datamodule import (
     DataModule,
     FieldConfig,
@@ -8,13 +14,19 @@ from collatable.extras.datamodule import (
 )
 from collatable.extras.dataset import Dataset
 from collatable.extras.indexer import Indexer, LabelIndexer, TokenIndexer
+from collatable.extras.table import InstanceTable
 
 __all__ = [
+    "AsyncBatchIterator",
+    "AsyncDataModule",
     "DataLoader",
     "DefaultBatchSampler",
     "DataModule",
+    "DataModuleCache",
     "Dataset",
+    "StreamingBatchSampler",
     "Indexer",
+    "InstanceTable",
     "LabelIndexer",
     "TokenIndexer",
     "FieldConfig",
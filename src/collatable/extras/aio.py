@@ -0,0 +1,137 @@
+import asyncio
+import functools
+import itertools
+from collections import deque
+from concurrent.futures import Executor
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+from collatable.collator import Collator
+from collatable.extras.datamodule import DataModule
+from collatable.fields import Field
+from collatable.types import DataArray
+
+S = TypeVar("S")
+T = TypeVar("T")
+
+
+def _next_chunk(iterator: Iterator[T], size: int) -> List[T]:
+    return list(itertools.islice(iterator, size))
+
+
+async def _iter_chunks(
+    source: Union[AsyncIterable[T], Iterable[T]],
+    size: int,
+    drop_last: bool = False,
+) -> AsyncIterator[List[T]]:
+    chunk: List[T] = []
+    if isinstance(source, AsyncIterable):
+        async for item in source:
+            chunk.append(item)
+            if len(chunk) == size:
+                yield chunk
+                chunk = []
+    else:
+        # Sync sources may be lazy pipelines (e.g. a DataModule generator), so
+        # they are pulled in a worker thread to keep the event loop free.
+        loop = asyncio.get_running_loop()
+        iterator = iter(source)
+        while True:
+            chunk = await loop.run_in_executor(None, _next_chunk, iterator, size)
+            if len(chunk) < size:
+                break
+            yield chunk
+    if chunk and not drop_last:
+        yield chunk
+
+
+async def _map_in_executor(
+    func: Callable[[S], T],
+    source: AsyncIterator[S],
+    executor: Optional[Executor],
+    max_pending: int,
+) -> AsyncIterator[T]:
+    loop = asyncio.get_running_loop()
+    pending: Deque["asyncio.Future[T]"] = deque()
+    async for item in source:
+        pending.append(loop.run_in_executor(executor, func, item))
+        if len(pending) >= max_pending:
+            yield await pending.popleft()
+    while pending:
+        yield await pending.popleft()
+
+
+def _transform(datamodule: DataModule[T], chunk: List[T]) -> List[Dict[str, Field]]:
+    return list(datamodule(chunk))
+
+
+class AsyncDataModule(Generic[T]):
+    def __init__(
+        self,
+        datamodule: DataModule[T],
+        *,
+        executor: Optional[Executor] = None,
+        chunk_size: int = 64,
+        max_pending: int = 4,
+    ) -> None:
+        self._datamodule = datamodule
+        self._executor = executor
+        self._chunk_size = chunk_size
+        self._max_pending = max_pending
+
+    @property
+    def datamodule(self) -> DataModule[T]:
+        return self._datamodule
+
+    async def __call__(
+        self,
+        source: Union[AsyncIterable[T], Iterable[T]],
+    ) -> AsyncIterator[Dict[str, Field]]:
+        async for instances in _map_in_executor(
+            functools.partial(_transform, self._datamodule),
+            _iter_chunks(source, self._chunk_size),
+            self._executor,
+            self._max_pending,
+        ):
+            for instance in instances:
+                yield instance
+
+
+class AsyncBatchIterator:
+    def __init__(
+        self,
+        source: Union[
+            AsyncIterable[Mapping[str, Field]], Iterable[Mapping[str, Field]]
+        ],
+        batch_size: int = 1,
+        *,
+        drop_last: bool = False,
+        collator: Optional[Collator] = None,
+        executor: Optional[Executor] = None,
+        max_pending: int = 4,
+    ) -> None:
+        self._batches = _map_in_executor(
+            collator or Collator(),
+            _iter_chunks(source, batch_size, drop_last),
+            executor,
+            max_pending,
+        )
+
+    def __aiter__(self) -> AsyncIterator[Dict[str, DataArray]]:
+        return self
+
+    async def __anext__(self) -> Dict[str, DataArray]:
+        return await self._batches.__anext__()
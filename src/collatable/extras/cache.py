@@ -0,0 +1,53 @@
+import os
+import shutil
+from os import PathLike
+from pathlib import Path
+from typing import Any, Dict, Iterable, TypeVar, Union
+
+from collatable.extras.datamodule import DataModule
+from collatable.extras.dataset import Dataset
+from collatable.extras.fingerprint import fingerprint, fingerprint_source
+from collatable.fields import Field
+
+T = TypeVar("T")
+
+
+class DataModuleCache:
+    def __init__(self, cache_dir: Union[str, PathLike]) -> None:
+        self._cache_dir = Path(cache_dir)
+
+    @property
+    def cache_dir(self) -> Path:
+        return self._cache_dir
+
+    def get_path(self, datamodule: DataModule, source: Any) -> Path:
+        key = fingerprint((datamodule.fingerprint(), fingerprint_source(source)))
+        return self._cache_dir / key
+
+    def __call__(
+        self,
+        datamodule: DataModule[T],
+        dataset: Iterable[T],
+        *,
+        source: Any,
+        num_workers: int = 0,
+        chunk_size: int = 256,
+    ) -> Dataset[Dict[str, Field]]:
+        path = self.get_path(datamodule, source)
+        if not path.exists():
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            temppath = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            if temppath.exists():
+                shutil.rmtree(temppath)
+            instances = Dataset.from_iterable(
+                datamodule(dataset, num_workers=num_workers, chunk_size=chunk_size),
+                path=temppath,
+            )
+            instances.close()
+            try:
+                temppath.rename(path)
+            except OSError:
+                if not path.exists():
+                    raise
+                shutil.rmtree(temppath)
+        return Dataset[Dict[str, Field]].from_path(path)
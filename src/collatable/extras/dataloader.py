@@ -1,17 +1,24 @@
 import math
 import random
 from typing import (
+    Any,
+    Callable,
     Dict,
     Iterable,
     Iterator,
+    List,
     Mapping,
     Optional,
     Protocol,
     Sequence,
     TypeVar,
+    Union,
+    cast,
+    overload,
 )
 
 from collatable.collator import Collator
+from collatable.extras.table import InstanceTable
 from collatable.fields import Field
 from collatable.types import DataArray
 
@@ -45,6 +52,8 @@ class BatchIterator(SizedIterator[Dict[str, DataArray]]):
 
     def __next__(self) -> Dict[str, DataArray]:
         indices = next(self._indices)
+        if isinstance(self._dataset, InstanceTable):
+            return self._dataset.collate(indices, self._collator)
         return self._collator([self._dataset[i] for i in indices])
 
     def __iter__(self) -> Iterator[Dict[str, DataArray]]:
@@ -55,6 +64,12 @@ class IBatchSampler(Protocol):
     def __call__(self, dataset: Sequence) -> SizedIterator[Mapping[str, DataArray]]: ...
 
 
+class IStreamingBatchSampler(Protocol):
+    def __call__(
+        self, dataset: Iterable[Mapping[str, Field]]
+    ) -> Iterator[Mapping[str, DataArray]]: ...
+
+
 class DefaultBatchSampler:
     def __init__(
         self,
@@ -85,16 +100,79 @@ class DefaultBatchSampler:
         return BatchIterator(dataset, iter_batches(), num_batches)
 
 
+class StreamingBatchSampler:
+    def __init__(
+        self,
+        batch_size: int = 1,
+        buffer_size: int = 1000,
+        shuffle: bool = False,
+        drop_last: bool = False,
+        sort_key: Optional[Callable[[Mapping[str, Field]], Any]] = None,
+        collator: Optional[Collator] = None,
+    ) -> None:
+        if buffer_size < batch_size:
+            raise ValueError("buffer_size must be greater than or equal to batch_size")
+        self._batch_size = batch_size
+        self._buffer_size = buffer_size
+        self._shuffle = shuffle
+        self._drop_last = drop_last
+        self._sort_key = sort_key
+        self._collator = collator or Collator()
+
+    def _split(
+        self, buffer: List[Mapping[str, Field]]
+    ) -> List[List[Mapping[str, Field]]]:
+        if self._shuffle:
+            random.shuffle(buffer)
+        if self._sort_key is not None:
+            buffer.sort(key=self._sort_key)
+        batches = [
+            buffer[start : start + self._batch_size]
+            for start in range(0, len(buffer), self._batch_size)
+        ]
+        if self._shuffle:
+            random.shuffle(batches)
+        return batches
+
+    def __call__(
+        self, dataset: Iterable[Mapping[str, Field]]
+    ) -> Iterator[Dict[str, DataArray]]:
+        buffer: List[Mapping[str, Field]] = []
+        for instance in dataset:
+            buffer.append(instance)
+            if len(buffer) < self._buffer_size:
+                continue
+            batches, buffer = self._split(buffer), []
+            for batch in batches:
+                if len(batch) < self._batch_size:
+                    buffer = batch
+                else:
+                    yield self._collator(batch)
+        for batch in self._split(buffer) if buffer else []:
+            if len(batch) == self._batch_size or not self._drop_last:
+                yield self._collator(batch)
+
+
 class DataLoader:
     def __init__(
         self,
-        sampler: Optional[IBatchSampler] = None,
+        sampler: Optional[Union[IBatchSampler, IStreamingBatchSampler]] = None,
         collator: Optional[Collator] = None,
     ) -> None:
         self._sampler = sampler or DefaultBatchSampler()
         self._collator = collator or Collator()
 
+    @overload
     def __call__(
         self, dataset: Sequence[Mapping[str, Field]]
-    ) -> SizedIterator[Mapping[str, DataArray]]:
-        return self._sampler(dataset)
+    ) -> SizedIterator[Mapping[str, DataArray]]: ...
+
+    @overload
+    def __call__(
+        self, dataset: Iterable[Mapping[str, Field]]
+    ) -> Iterator[Mapping[str, DataArray]]: ...
+
+    def __call__(
+        self, dataset: Iterable[Mapping[str, Field]]
+    ) -> Iterator[Mapping[str, DataArray]]:
+        return cast(IStreamingBatchSampler, self._sampler)(dataset)
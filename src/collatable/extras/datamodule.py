@@ -1,24 +1,38 @@
+import itertools
+import operator
 import re
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass
 from typing import (
     Any,
     Callable,
+    Deque,
     Dict,
     Generic,
     Hashable,
     Iterable,
+    Iterator,
+    List,
     Mapping,
+    NamedTuple,
     Optional,
     Protocol,
     Sequence,
+    Tuple,
     TypeVar,
     Union,
     cast,
     runtime_checkable,
 )
 
+import numpy
+
 from collatable import Field, LabelField, TextField
+from collatable.extras.fingerprint import fingerprint
 from collatable.types import DataArray, IntTensor, Scalar, Tensor
+from collatable.utils import debatched
 
 S = TypeVar("S")
 T = TypeVar("T")
@@ -56,15 +70,74 @@ class ISequenceIndexer(Protocol[HashableT, IndexT]):
     def decode(self, index: IndexT, /) -> Sequence[HashableT]: ...
 
 
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
 class FieldAccessor:
     def __init__(self, field: str) -> None:
         self._field = field.split(".")
+        self._accessors: Dict[type, Callable[[Any], Any]] = {}
 
-    def __call__(self, obj: Any) -> Any:
-        for part in self._field:
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"_field": self._field}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self._field = state["_field"]
+        self._accessors = {}
+
+    @staticmethod
+    def _make_getter(part: str, obj: Any) -> Callable[[Any], Any]:
+        if isinstance(obj, Mapping):
+            return operator.itemgetter(part)
+        return operator.attrgetter(part)
+
+    def _access(self, obj: Any, start: int = 0) -> Any:
+        for part in self._field[start:]:
             obj = obj[part] if isinstance(obj, Mapping) else getattr(obj, part)
         return obj
 
+    def _compile(self, obj: Any) -> Callable[[Any], Any]:
+        steps: List[Tuple[type, Callable[[Any], Any]]] = []
+        for part in self._field:
+            getter = self._make_getter(part, obj)
+            steps.append((type(obj), getter))
+            obj = getter(obj)
+        if len(steps) == 1:
+            return steps[0][1]
+
+        def accessor(obj: Any) -> Any:
+            for level, (obj_type, getter) in enumerate(steps):
+                if type(obj) is not obj_type:
+                    return self._access(obj, level)
+                obj = getter(obj)
+            return obj
+
+        return accessor
+
+    def __call__(self, obj: Any) -> Any:
+        accessor = self._accessors.get(type(obj))
+        if accessor is None:
+            accessor = self._accessors[type(obj)] = self._compile(obj)
+        return accessor(obj)
+
+    def batch(self, objs: Iterable[Any]) -> List[Any]:
+        values = list(objs)
+        for part in self._field:
+            if not values:
+                break
+            if len(set(map(type, values))) == 1:
+                values = list(map(self._make_getter(part, values[0]), values))
+            else:
+                values = [
+                    value[part] if isinstance(value, Mapping) else getattr(value, part)
+                    for value in values
+                ]
+        return values
+
 
 class FieldTransform(Generic[S]):
     def __call__(self, obj: S) -> Field:
@@ -73,7 +146,22 @@ class FieldTransform(Generic[S]):
     def reconstruct(self, array: DataArray) -> S:
         raise NotImplementedError
 
+    def reconstruct_batch(self, array: DataArray) -> Sequence[S]:
+        return [self.reconstruct(item) for item in debatched(array)]
+
+    def batch(self, objs: Sequence[S]) -> DataArray:
+        fields = [self(obj) for obj in objs]
+        return fields[0].collate(fields)
+
     def build(self, dataset: Iterable[S]) -> None:
+        for obj in dataset:
+            self.update(obj)
+        self.finalize()
+
+    def update(self, obj: S) -> None:
+        pass
+
+    def finalize(self) -> None:
         pass
 
     def indexers(self) -> Mapping[str, IIndexer]:
@@ -98,12 +186,12 @@ class TextFieldTransform(
         unk_token: Optional[HashableT] = None,
         special_tokens: Optional[Sequence[HashableT]] = None,
         indexer: Optional[ISequenceIndexer[HashableT, Mapping[str, Tensor]]] = None,
+        cache_size: int = 0,
+        store_mask: bool = True,
     ) -> None:
         from .indexer import TokenIndexer
 
-        self._tokenizer = tokenizer or (
-            lambda text: self._DEFAULT_TOKENIZER_PATTERN.findall(text)
-        )
+        self._tokenizer = tokenizer or self._DEFAULT_TOKENIZER_PATTERN.findall
         self._indexer: ISequenceIndexer[HashableT, Mapping[str, Tensor]] = (
             indexer if indexer is not None else TokenIndexer[HashableT]()
         )
@@ -113,36 +201,146 @@ class TextFieldTransform(
             self._special_tokens = [unk_token, *self._special_tokens]
         if pad_token is not None and pad_token not in self._special_tokens:
             self._special_tokens = [pad_token, *self._special_tokens]
+        # TokenIndexer assigns ids in order of first appearance, so its updates
+        # can be deduplicated; other indexers see every text as in a full pass.
+        self._deduplicate_updates = type(self._indexer) is TokenIndexer
+        self._pending_tokens: Dict[HashableT, None] = {}
+        self._pending_texts: List[Sequence[HashableT]] = []
+        self._cache_size = cache_size
+        self._store_mask = store_mask
+        self._cache: OrderedDict[
+            str, Tuple[Sequence[HashableT], Mapping[str, Tensor]]
+        ] = OrderedDict()
+        self._cache_vocab_size = 0
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_lock = threading.RLock()
 
     def __call__(self, obj: Union[str, Sequence[HashableT]]) -> TextField:
+        padding_value = self._get_padding_value()
+        if (
+            isinstance(obj, str)
+            and self._cache_size > 0
+            and not getattr(self._indexer, "training", False)
+        ):
+            tokens, indexed_tokens = self._encode_with_cache(obj)
+            return TextField(
+                tokens,
+                indexer=lambda _: indexed_tokens,
+                padding_value=padding_value,
+                store_mask=self._store_mask,
+            )
         if isinstance(obj, str):
             obj = self._tokenizer(obj)
         return TextField(
             obj,
             indexer=self._indexer.encode,
-            padding_value=self._indexer[self._pad_token]
-            if self._pad_token is not None
-            else 0,
+            padding_value=padding_value,
+            store_mask=self._store_mask,
         )
 
+    def batch(self, objs: Sequence[Union[str, Sequence[HashableT]]]) -> DataArray:
+        encode_batch = getattr(self._indexer, "encode_batch", None)
+        if encode_batch is None:
+            return super().batch(objs)
+        # Field.collate pads token ids by key, so the scalar padding value
+        # given to TextField never applies to them.
+        return cast(
+            DataArray,
+            encode_batch(
+                [self._tokenizer(obj) if isinstance(obj, str) else obj for obj in objs],
+                padding_index=0,
+            ),
+        )
+
+    def _get_padding_value(self) -> int:
+        return self._indexer[self._pad_token] if self._pad_token is not None else 0
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_cache"] = OrderedDict()
+        state["_cache_vocab_size"] = 0
+        state["_cache_hits"] = 0
+        state["_cache_misses"] = 0
+        del state["_cache_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._cache_lock = threading.RLock()
+
+    def _encode_with_cache(
+        self, text: str
+    ) -> Tuple[Sequence[HashableT], Mapping[str, Tensor]]:
+        # transforms may run in several threads at once (see extras.aio), so
+        # the memo is only touched under the lock; encoding happens outside it
+        with self._cache_lock:
+            if len(self._indexer) != self._cache_vocab_size:
+                self._cache.clear()
+                self._cache_vocab_size = len(self._indexer)
+            cached = self._cache.get(text)
+            if cached is not None:
+                self._cache_hits += 1
+                self._cache.move_to_end(text)
+                return cached
+            self._cache_misses += 1
+        tokens = self._tokenizer(text)
+        indexed_tokens = self._indexer.encode(tokens)
+        for array in indexed_tokens.values():
+            array.flags.writeable = False
+        with self._cache_lock:
+            self._cache[text] = (tokens, indexed_tokens)
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return tokens, indexed_tokens
+
+    def cache_info(self) -> CacheInfo:
+        with self._cache_lock:
+            return CacheInfo(
+                self._cache_hits,
+                self._cache_misses,
+                self._cache_size,
+                len(self._cache),
+            )
+
+    def cache_clear(self) -> None:
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_hits = 0
+            self._cache_misses = 0
+
     def reconstruct(self, array: DataArray) -> Sequence[HashableT]:
         assert isinstance(array, Mapping)
         field = TextField[HashableT].from_array(
             array,
             indexer=self._indexer,
-            padding_value=self._indexer[self._pad_token]
-            if self._pad_token is not None
-            else 0,
+            padding_value=self._get_padding_value(),
         )
         return field.tokens
 
-    def build(self, dataset: Iterable[Union[str, Sequence[HashableT]]]) -> None:
+    def reconstruct_batch(self, array: DataArray) -> Sequence[Sequence[HashableT]]:
+        decode_batch = getattr(self._indexer, "decode_batch", None)
+        if decode_batch is None:
+            return [self.reconstruct(item) for item in debatched(array)]
+        return decode_batch(array)
+
+    def update(self, obj: Union[str, Sequence[HashableT]]) -> None:
+        if isinstance(obj, str):
+            obj = self._tokenizer(obj)
+        if self._deduplicate_updates:
+            self._pending_tokens.update(dict.fromkeys(obj))
+        else:
+            self._pending_texts.append(obj)
+
+    def finalize(self) -> None:
         for special_token in self._special_tokens:
             self._indexer[special_token]
-        for text in dataset:
-            if isinstance(text, str):
-                text = self._tokenizer(text)
+        if self._pending_tokens:
+            self._indexer.encode(list(self._pending_tokens))
+        for text in self._pending_texts:
             self._indexer.encode(text)
+        self._pending_tokens.clear()
+        self._pending_texts.clear()
 
     def indexers(self) -> Mapping[str, IIndexer]:
         return {"tokens": self._indexer}
@@ -158,23 +356,50 @@ class LabelFieldTransform(FieldTransform[HashableT]):
         self._indexer: IIndexer[HashableT, int] = (
             indexer if indexer is not None else LabelIndexer[HashableT]()
         )
+        self._pending_labels: Dict[HashableT, None] = {}
 
     def __call__(self, obj: HashableT) -> LabelField:
-        return LabelField(obj, indexer=self._indexer.encode)
+        return LabelField(
+            obj,
+            indexer=self._indexer.encode,
+            dtype=getattr(self._indexer, "dtype", numpy.int_),
+        )
+
+    def batch(self, objs: Sequence[HashableT]) -> DataArray:
+        encode_batch = getattr(self._indexer, "encode_batch", None)
+        if encode_batch is None or any(
+            issubclass(obj_type, int) for obj_type in set(map(type, objs))
+        ):
+            return super().batch(objs)
+        return cast(IntTensor, encode_batch(objs))
 
     def reconstruct(self, array: DataArray) -> HashableT:
         array = cast(IntTensor, array)
         field = LabelField[HashableT].from_array(array, indexer=self._indexer)
         return field.label
 
-    def build(self, dataset: Iterable[HashableT]) -> None:
-        for label in dataset:
+    def reconstruct_batch(self, array: DataArray) -> Sequence[HashableT]:
+        decode_batch = getattr(self._indexer, "decode_batch", None)
+        if decode_batch is None:
+            return super().reconstruct_batch(array)
+        return decode_batch(array)
+
+    def update(self, obj: HashableT) -> None:
+        self._pending_labels[obj] = None
+
+    def finalize(self) -> None:
+        for label in self._pending_labels:
             self._indexer(label)
+        self._pending_labels.clear()
 
     def indexers(self) -> Mapping[str, IIndexer[HashableT, int]]:
         return {"labels": self._indexer}
 
 
+def _is_incremental(transform: FieldTransform) -> bool:
+    return type(transform).build is FieldTransform.build
+
+
 @dataclass
 class FieldConfig(Generic[S, T]):
     accessor: Callable[[S], T]
@@ -184,6 +409,10 @@ class FieldConfig(Generic[S, T]):
     def reconstruct(self) -> Callable[[DataArray], T]:
         return self.transform.reconstruct
 
+    @property
+    def reconstruct_batch(self) -> Callable[[DataArray], Sequence[T]]:
+        return self.transform.reconstruct_batch
+
 
 class DataModule(Generic[T]):
     def __init__(
@@ -204,17 +433,119 @@ class DataModule(Generic[T]):
         return self._fields
 
     def build(self, dataset: Iterable[T]) -> None:
+        incremental_fields = [
+            field for field in self._fields.values() if _is_incremental(field.transform)
+        ]
+        num_passes = (
+            bool(incremental_fields) + len(self._fields) - len(incremental_fields)
+        )
+        if num_passes > 1 and iter(dataset) is dataset:
+            raise ValueError(
+                "DataModule.build requires a re-iterable dataset when some "
+                "transforms do not support incremental updates."
+            )
+        if incremental_fields:
+            for obj in dataset:
+                for field in incremental_fields:
+                    field.transform.update(field.accessor(obj))
         for field in self._fields.values():
-            field.transform.build(field.accessor(obj) for obj in dataset)
+            if _is_incremental(field.transform):
+                field.transform.finalize()
+            else:
+                field.transform.build(field.accessor(obj) for obj in dataset)
 
-    def __call__(self, dataset: Iterable[T]) -> Iterable[Dict[str, Field]]:
+    def __call__(
+        self,
+        dataset: Iterable[T],
+        *,
+        num_workers: int = 0,
+        chunk_size: int = 256,
+    ) -> Iterable[Dict[str, Field]]:
+        if num_workers <= 0:
+            return self._iter_instances(dataset)
+        for name, field in self._fields.items():
+            for indexer in field.transform.indexers().values():
+                if getattr(indexer, "training", False):
+                    raise ValueError(
+                        f"Indexers of field {name!r} must be frozen "
+                        "to process instances in parallel."
+                    )
+        return self._iter_instances_in_parallel(dataset, num_workers, chunk_size)
+
+    def collate_batch(self, objs: Iterable[T]) -> Dict[str, DataArray]:
+        objs = list(objs)
+        if not objs:
+            return {}
+        return {
+            name: field.transform.batch(
+                field.accessor.batch(objs)
+                if isinstance(field.accessor, FieldAccessor)
+                else [field.accessor(obj) for obj in objs]
+            )
+            for name, field in self._fields.items()
+        }
+
+    def _iter_instances(self, dataset: Iterable[T]) -> Iterator[Dict[str, Field]]:
         for obj in dataset:
             yield {
                 name: field.transform(field.accessor(obj))
                 for name, field in self._fields.items()
             }
 
+    def _iter_instances_in_parallel(
+        self,
+        dataset: Iterable[T],
+        num_workers: int,
+        chunk_size: int,
+    ) -> Iterator[Dict[str, Field]]:
+        iterator = iter(dataset)
+        chunks = iter(lambda: list(itertools.islice(iterator, chunk_size)), [])
+        with ProcessPoolExecutor(
+            num_workers,
+            initializer=_initialize_worker,
+            initargs=(self,),
+        ) as executor:
+            futures: Deque[Future[List[Dict[str, Field]]]] = deque(
+                executor.submit(_transform_chunk, chunk)
+                for chunk in itertools.islice(chunks, 2 * num_workers)
+            )
+            while futures:
+                instances = futures.popleft().result()
+                for chunk in itertools.islice(chunks, 1):
+                    futures.append(executor.submit(_transform_chunk, chunk))
+                yield from instances
+
+    def fingerprint(self) -> str:
+        return fingerprint(
+            [
+                (name, field.accessor, field.transform)
+                for name, field in self._fields.items()
+            ]
+        )
+
     def reconstruct(self, array: Mapping[str, DataArray]) -> Mapping[str, Any]:
         return {
             name: field.reconstruct(array[name]) for name, field in self._fields.items()
         }
+
+    def reconstruct_batch(
+        self, batch: Mapping[str, DataArray]
+    ) -> List[Mapping[str, Any]]:
+        columns = {
+            name: field.reconstruct_batch(batch[name])
+            for name, field in self._fields.items()
+        }
+        return [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+
+_worker_datamodule: Optional[DataModule] = None
+
+
+def _initialize_worker(datamodule: DataModule) -> None:
+    global _worker_datamodule
+    _worker_datamodule = datamodule
+
+
+def _transform_chunk(chunk: List[Any]) -> List[Dict[str, Field]]:
+    assert _worker_datamodule is not None
+    return list(_worker_datamodule._iter_instances(chunk))
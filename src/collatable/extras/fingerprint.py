@@ -0,0 +1,137 @@
+import hashlib
+import os
+import re
+import types
+from os import PathLike
+from pathlib import Path
+from typing import Any, Hashable, List, Mapping, Set
+
+import numpy
+
+
+def _get_state(obj: Any) -> Any:
+    getstate = getattr(type(obj), "__getstate__", None)
+    if getstate is not None and getstate is not getattr(object, "__getstate__", None):
+        return obj.__getstate__()
+    state = dict(getattr(obj, "__dict__", {}))
+    for cls in type(obj).__mro__:
+        for slot in getattr(cls, "__slots__", ()):
+            if hasattr(obj, slot):
+                state[slot] = getattr(obj, slot)
+    return state
+
+
+def _has_contents(cell: Any) -> bool:
+    try:
+        cell.cell_contents
+    except ValueError:
+        return False
+    return True
+
+
+def _normalize(value: Any, seen: Set[int]) -> Hashable:
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+        return (type(value).__name__, value)
+    if isinstance(value, numpy.ndarray):
+        digest = hashlib.sha256(numpy.ascontiguousarray(value).tobytes()).hexdigest()
+        return ("ndarray", value.dtype.str, value.shape, digest)
+    if isinstance(value, type):
+        return ("type", value.__module__, value.__qualname__)
+    if isinstance(value, re.Pattern):
+        return ("pattern", value.pattern, value.flags)
+    if isinstance(value, types.CodeType):
+        return (
+            "code",
+            value.co_code,
+            tuple(_normalize(const, seen) for const in value.co_consts),
+            value.co_names,
+        )
+    if isinstance(
+        value,
+        (
+            types.MethodDescriptorType,
+            types.WrapperDescriptorType,
+            types.ClassMethodDescriptorType,
+        ),
+    ):
+        return (
+            "descriptor",
+            _normalize(value.__objclass__, seen),
+            value.__qualname__,
+        )
+    if isinstance(value, types.BuiltinFunctionType) and (
+        value.__self__ is None or isinstance(value.__self__, types.ModuleType)
+    ):
+        return ("function", value.__module__, value.__qualname__)
+    if isinstance(
+        value,
+        (types.MethodType, types.BuiltinMethodType, types.MethodWrapperType),
+    ):
+        return ("method", value.__name__, _normalize(value.__self__, seen))
+
+    if id(value) in seen:
+        return ("cycle", type(value).__qualname__)
+    seen = seen | {id(value)}
+    if isinstance(value, types.FunctionType):
+        closure = tuple(
+            _normalize(cell.cell_contents, seen) if _has_contents(cell) else ("empty",)
+            for cell in value.__closure__ or ()
+        )
+        return (
+            "function",
+            value.__module__,
+            value.__qualname__,
+            _normalize(value.__code__, seen),
+            _normalize(value.__defaults__, seen),
+            _normalize(value.__kwdefaults__, seen),
+            closure,
+        )
+    if isinstance(value, (list, tuple)):
+        return (
+            type(value).__name__,
+            tuple(_normalize(item, seen) for item in value),
+        )
+    if isinstance(value, (set, frozenset)):
+        return (
+            type(value).__name__,
+            tuple(sorted((_normalize(item, seen) for item in value), key=repr)),
+        )
+    if isinstance(value, Mapping):
+        return (
+            type(value).__name__,
+            tuple(
+                (_normalize(key, seen), _normalize(item, seen))
+                for key, item in value.items()
+            ),
+        )
+    state = _get_state(value)
+    if not state:
+        try:
+            reduced = value.__reduce_ex__(4)
+        except Exception as error:
+            raise ValueError(
+                f"Cannot fingerprint object of type {type(value).__qualname__}"
+            ) from error
+        state = reduced if isinstance(reduced, str) else reduced[1:3]
+    return (
+        type(value).__module__,
+        type(value).__qualname__,
+        _normalize(state, seen),
+    )
+
+
+def fingerprint(obj: Any) -> str:
+    return hashlib.sha256(repr(_normalize(obj, set())).encode()).hexdigest()
+
+
+def fingerprint_source(source: Any) -> str:
+    if isinstance(source, (str, PathLike)) and os.path.exists(source):
+        path = Path(source).resolve()
+        filenames = sorted(path.rglob("*")) if path.is_dir() else [path]
+        identity: List[Any] = [str(path)]
+        for filename in filenames:
+            if filename.is_file():
+                stat = filename.stat()
+                identity.append((str(filename), stat.st_size, stat.st_mtime_ns))
+        return fingerprint(identity)
+    return fingerprint(source)
@@ -1,29 +1,38 @@
+import itertools
 from contextlib import contextmanager
 from typing import (
+    Any,
+    Collection,
     Dict,
     Generic,
     Hashable,
     Iterable,
     Iterator,
     List,
+    Literal,
     Mapping,
     Optional,
     Sequence,
     Set,
+    Tuple,
     TypeVar,
     Union,
     cast,
 )
 
 import numpy
+from numpy.typing import DTypeLike
 
-from collatable.types import Tensor
+from collatable.types import BoolTensor, IntTensor, Tensor
+from collatable.utils import cast_indices, get_index_dtype
 
 ValueT = TypeVar("ValueT", bound=Hashable)
 Self = TypeVar("Self", bound="Indexer")
 
 
 class Indexer(Generic[ValueT]):
+    _DEFAULT_DTYPE: DTypeLike = numpy.int64
+
     def __init__(
         self,
         *,
@@ -32,6 +41,7 @@ class Indexer(Generic[ValueT]):
         bos: Optional[ValueT] = None,
         eos: Optional[ValueT] = None,
         default: Optional[ValueT] = None,
+        dtype: Optional[Union[DTypeLike, Literal["auto"]]] = None,
     ) -> None:
         if bos is not None and bos not in specials:
             raise ValueError("bos value must be in specials")
@@ -49,13 +59,30 @@ class Indexer(Generic[ValueT]):
         self._eos_value = cast(ValueT, eos)
         self._default_value = cast(ValueT, default)
         self._training = False
+        self._value_array: Optional[numpy.ndarray] = None
+        self._dtype = dtype
 
     def __len__(self) -> int:
         return len(self._index_to_value)
 
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_value_array"] = None
+        return state
+
     def __getitem__(self, value: ValueT) -> int:
         return self.get_index_by_value(value)
 
+    @property
+    def dtype(self) -> numpy.dtype:
+        if self._dtype is None:
+            return numpy.dtype(self._DEFAULT_DTYPE)
+        if isinstance(self._dtype, str) and self._dtype == "auto":
+            if self._training:
+                return numpy.dtype(numpy.int64)
+            return get_index_dtype(len(self))
+        return numpy.dtype(self._dtype)
+
     @property
     def training(self) -> bool:
         return self._training
@@ -82,6 +109,13 @@ class Indexer(Generic[ValueT]):
     def get_value_by_index(self, index: int) -> ValueT:
         return self._index_to_value[index]
 
+    def get_values_by_indices(self, indices: IntTensor) -> numpy.ndarray:
+        if self._value_array is None or len(self._value_array) != len(self):
+            self._value_array = numpy.empty(len(self), dtype=object)
+            for index, value in enumerate(self._index_to_value):
+                self._value_array[index] = value
+        return self._value_array[indices]
+
     def get_index_by_value(self, value: ValueT) -> int:
         if self._default_value is not None and value in self._ignores:
             return self._value_to_index[self._default_value]
@@ -94,6 +128,26 @@ class Indexer(Generic[ValueT]):
             self._index_to_value.append(value)
         return self._value_to_index[value]
 
+    def get_indices_by_values(
+        self,
+        values: Iterable[ValueT],
+        dtype: Optional[DTypeLike] = None,
+    ) -> IntTensor:
+        indices: Iterator[int]
+        if self._training or (self._ignores and self._default_value is not None):
+            indices = map(self.get_index_by_value, values)
+        elif self._default_value is None:
+            indices = map(self._value_to_index.__getitem__, values)
+        else:
+            default_index = self._value_to_index[self._default_value]
+            indices = map(
+                self._value_to_index.get, values, itertools.repeat(default_index)
+            )
+        return cast_indices(
+            numpy.fromiter(indices, dtype=numpy.int64),
+            self.dtype if dtype is None else dtype,
+        )
+
     @classmethod
     def from_iterable(
         cls,
@@ -104,9 +158,15 @@ class Indexer(Generic[ValueT]):
         bos: Optional[ValueT] = None,
         eos: Optional[ValueT] = None,
         default: Optional[ValueT] = None,
+        dtype: Optional[Union[DTypeLike, Literal["auto"]]] = None,
     ) -> "Indexer[ValueT]":
         indexer = cls(
-            ignores=ignores, specials=specials, bos=bos, eos=eos, default=default
+            ignores=ignores,
+            specials=specials,
+            bos=bos,
+            eos=eos,
+            default=default,
+            dtype=dtype,
         )
         with indexer.context(train=True):
             for value in iterable:
@@ -148,6 +208,7 @@ class Indexer(Generic[ValueT]):
         bos: Optional[ValueT] = None,
         eos: Optional[ValueT] = None,
         default: Optional[ValueT] = None,
+        dtype: Optional[Union[DTypeLike, Literal["auto"]]] = None,
     ) -> "Indexer[ValueT]":
         num_documents = 0
         value_to_df: Dict[ValueT, int] = {}
@@ -160,7 +221,12 @@ class Indexer(Generic[ValueT]):
         max_df = int(max_df) if isinstance(max_df, int) else int(max_df * num_documents)
 
         indexer = cls(
-            ignores=ignores, specials=specials, bos=bos, eos=eos, default=default
+            ignores=ignores,
+            specials=specials,
+            bos=bos,
+            eos=eos,
+            default=default,
+            dtype=dtype,
         )
         with indexer.context(train=True):
             for token, df in list(value_to_df.items()):
@@ -171,6 +237,10 @@ class Indexer(Generic[ValueT]):
 
 
 class TokenIndexer(Generic[ValueT], Indexer[ValueT]):
+    @property
+    def num_special_tokens(self) -> Tuple[int, int]:
+        return int(self._bos_value is not None), int(self._eos_value is not None)
+
     def encode(self, tokens: Sequence[ValueT]) -> Mapping[str, Tensor]:
         token_ids = [self.get_index_by_value(value) for value in tokens]
         if self._bos_value is not None:
@@ -178,12 +248,44 @@ class TokenIndexer(Generic[ValueT], Indexer[ValueT]):
         if self._eos_value is not None:
             token_ids = token_ids + [self._value_to_index[self._eos_value]]
         return {
-            "token_ids": numpy.array(token_ids, dtype=numpy.int64),
+            "token_ids": cast_indices(
+                numpy.array(token_ids, dtype=numpy.int64), self.dtype
+            ),
             "mask": numpy.ones(len(token_ids), dtype=bool),
         }
 
+    def encode_batch(
+        self,
+        batch: Sequence[Sequence[ValueT]],
+        *,
+        padding_index: int = 0,
+    ) -> Dict[str, Tensor]:
+        num_specials = (self._bos_value is not None) + (self._eos_value is not None)
+        token_lengths = numpy.fromiter(map(len, batch), dtype=numpy.int64)
+        lengths = token_lengths + num_specials
+        max_length = int(lengths.max()) if len(batch) > 0 else 0
+        positions = numpy.arange(max_length)
+        mask: BoolTensor = positions < lengths[:, None]
+        token_ids = numpy.full((len(batch), max_length), padding_index, self.dtype)
+        offset = int(self._bos_value is not None)
+        token_mask = (positions >= offset) & (
+            positions < token_lengths[:, None] + offset
+        )
+        token_ids[token_mask] = self.get_indices_by_values(
+            itertools.chain.from_iterable(batch)
+        )
+        if self._bos_value is not None and max_length > 0:
+            token_ids[:, 0] = self._value_to_index[self._bos_value]
+        if self._eos_value is not None and max_length > 0:
+            token_ids[numpy.arange(len(batch)), lengths - 1] = self._value_to_index[
+                self._eos_value
+            ]
+        return {"token_ids": token_ids, "mask": mask}
+
     def decode(self, index: Mapping[str, Tensor]) -> Sequence[ValueT]:
         token_ids = index["token_ids"]
+        if "mask" not in index:
+            return [self.get_value_by_index(token_id) for token_id in token_ids]
         mask = index["mask"]
         return [
             self.get_value_by_index(token_id)
@@ -191,16 +293,66 @@ class TokenIndexer(Generic[ValueT], Indexer[ValueT]):
             if m
         ]
 
+    def decode_batch(self, index: Mapping[str, Tensor]) -> List[List[ValueT]]:
+        token_ids = index["token_ids"]
+        if len(token_ids) == 0:
+            return []
+        mask = index["mask"]
+        values = self.get_values_by_indices(token_ids[mask])
+        offsets = numpy.cumsum(mask.sum(axis=1))[:-1]
+        return [chunk.tolist() for chunk in numpy.split(values, offsets)]
+
     def __call__(self, tokens: Sequence[ValueT]) -> Mapping[str, Tensor]:
         return self.encode(tokens)
 
 
 class LabelIndexer(Generic[ValueT], Indexer[ValueT]):
+    _DEFAULT_DTYPE = numpy.int_
+
     def encode(self, label: ValueT) -> int:
         return self.get_index_by_value(label)
 
     def decode(self, index: int) -> ValueT:
         return self.get_value_by_index(index)
 
+    def encode_batch(self, labels: Iterable[ValueT]) -> IntTensor:
+        return self.get_indices_by_values(labels)
+
+    def decode_batch(self, indices: IntTensor) -> List[ValueT]:
+        return self.get_values_by_indices(indices).tolist()
+
+    def encode_multi_hot(
+        self,
+        label_sets: Sequence[Collection[ValueT]],
+        *,
+        packed: bool = False,
+    ) -> Tensor:
+        lengths = numpy.fromiter(map(len, label_sets), dtype=numpy.int64)
+        indices = self.get_indices_by_values(itertools.chain.from_iterable(label_sets))
+        rows = numpy.repeat(numpy.arange(len(label_sets)), lengths)
+        output: BoolTensor = numpy.zeros((len(label_sets), len(self)), dtype=bool)
+        output[rows, indices] = True
+        if packed:
+            return numpy.packbits(output, axis=1)
+        return output
+
+    def decode_multi_hot(
+        self,
+        array: Tensor,
+        *,
+        packed: bool = False,
+    ) -> List[List[ValueT]]:
+        if len(array) == 0:
+            return []
+        if packed:
+            array = numpy.unpackbits(array, axis=1, count=len(self))
+        rows, indices = numpy.nonzero(array)
+        values = [self._index_to_value[index] for index in indices.tolist()]
+        offsets = numpy.searchsorted(rows, numpy.arange(1, len(array))).tolist()
+        return [
+            values[start:end]
+            for start, end in zip([0, *offsets], [*offsets, len(values)])
+        ]
+
     def __call__(self, label: ValueT) -> int:
         return self.encode(label)
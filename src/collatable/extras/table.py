@@ -0,0 +1,237 @@
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+    overload,
+)
+
+import numpy
+
+from collatable.collator import Collator
+from collatable.fields import Field
+from collatable.types import ArrayLike, DataArray, IntTensor, Tensor
+
+
+def _flatten(array: Any) -> Optional[Dict[Tuple[str, ...], Tensor]]:
+    if isinstance(array, numpy.ndarray):
+        return {(): array}
+    if isinstance(array, Mapping) and all(
+        isinstance(value, numpy.ndarray) for value in array.values()
+    ):
+        return {(key,): value for key, value in array.items()}
+    return None
+
+
+def _unflatten(leaves: Mapping[Tuple[str, ...], DataArray]) -> DataArray:
+    if () in leaves:
+        return leaves[()]
+    return {path[0]: value for path, value in leaves.items()}
+
+
+class _ArrayColumn:
+    def __init__(
+        self,
+        values: Tensor,
+        offsets: IntTensor,
+        shapes: IntTensor,
+        padding_value: ArrayLike,
+    ) -> None:
+        self.values = values
+        self.offsets = offsets
+        self.shapes = shapes
+        self.padding_value = padding_value
+
+    @property
+    def nbytes(self) -> int:
+        return self.values.nbytes + self.offsets.nbytes + self.shapes.nbytes
+
+    def get(self, index: int) -> Tensor:
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return self.values[start:end].reshape(self.shapes[index])
+
+    def gather(self, indices: IntTensor) -> Tensor:
+        ndim = self.shapes.shape[1]
+        starts = self.offsets[indices]
+        if ndim == 0:
+            return self.values[starts]
+
+        shapes = self.shapes[indices]
+        max_shape = tuple(shapes.max(axis=0).tolist()) if len(indices) else (0,) * ndim
+        output = numpy.full(
+            (len(indices), *max_shape), self.padding_value, dtype=self.values.dtype
+        )
+        if ndim == 1:
+            lengths = shapes[:, 0]
+            rows = numpy.repeat(numpy.arange(len(indices)), lengths)
+            row_starts = numpy.cumsum(lengths) - lengths
+            cols = numpy.arange(len(rows)) - numpy.repeat(row_starts, lengths)
+            output[rows, cols] = self.values[numpy.repeat(starts, lengths) + cols]
+            return output
+        for row, index in enumerate(indices.tolist()):
+            output[(row, *map(slice, self.shapes[index]))] = self.get(index)
+        return output
+
+
+class InstanceTable(Sequence[Dict[str, Any]]):
+    def __init__(
+        self,
+        length: int,
+        array_columns: Mapping[str, Mapping[Tuple[str, ...], _ArrayColumn]],
+        object_columns: Mapping[str, Sequence[Field]],
+        prototypes: Mapping[str, Field],
+    ) -> None:
+        self._length = length
+        self._array_columns = array_columns
+        self._object_columns = object_columns
+        self._prototypes = prototypes
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> Dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Dict[str, Any]]: ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("InstanceTable index out of range")
+        instance: Dict[str, Any] = {
+            name: _unflatten(
+                {path: column.get(index) for path, column in columns.items()}
+            )
+            for name, columns in self._array_columns.items()
+        }
+        for name, fields in self._object_columns.items():
+            instance[name] = fields[index]
+        return instance
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for index in range(len(self)):
+            yield self[index]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(
+            column.nbytes
+            for columns in self._array_columns.values()
+            for column in columns.values()
+        )
+
+    def collate(
+        self,
+        indices: Sequence[int],
+        collator: Optional[Collator] = None,
+    ) -> Dict[str, DataArray]:
+        field_names = None if collator is None else collator.field_names
+        index_array = numpy.asarray(indices, dtype=numpy.int64)
+        output: Dict[str, DataArray] = {}
+        for name, prototype in self._prototypes.items():
+            if field_names is not None and name not in field_names:
+                continue
+            if name in self._object_columns:
+                fields = self._object_columns[name]
+                values = [fields[index] for index in index_array.tolist()]
+                array = values[0].collate(values)
+            else:
+                array = _unflatten(
+                    {
+                        path: column.gather(index_array)
+                        for path, column in self._array_columns[name].items()
+                    }
+                )
+            output[name] = (
+                array
+                if collator is None
+                else collator.postprocess(name, prototype, array)
+            )
+        return output
+
+    @classmethod
+    def from_instances(
+        cls, instances: Iterable[Mapping[str, Field]]
+    ) -> "InstanceTable":
+        length = 0
+        names: Optional[List[str]] = None
+        leaves: Dict[str, Dict[Tuple[str, ...], List[Tensor]]] = {}
+        padding_values: Dict[str, Mapping[str, ArrayLike]] = {}
+        object_columns: Dict[str, List[Field]] = {}
+        prototypes: Dict[str, Field] = {}
+        for instance in instances:
+            if names is None:
+                names = list(instance)
+                for name in names:
+                    field = prototypes[name] = instance[name]
+                    flattened = (
+                        _flatten(field.as_array())
+                        if field._has_padded_collate()
+                        else None
+                    )
+                    if flattened is None:
+                        object_columns[name] = []
+                    else:
+                        leaves[name] = {path: [] for path in flattened}
+                        padding_values[name] = field.padding_value
+            elif instance.keys() != set(names):
+                raise ValueError(
+                    "InstanceTable requires instances with the same fields."
+                )
+            for name in names:
+                field = instance[name]
+                if name in object_columns:
+                    object_columns[name].append(field)
+                    continue
+                flattened = _flatten(field.as_array())
+                if flattened is None or flattened.keys() != leaves[name].keys():
+                    raise ValueError(f"Field {name} has an inconsistent array layout.")
+                for path, array in flattened.items():
+                    leaves[name][path].append(array)
+            length += 1
+
+        if length == 0:
+            return cls(0, {}, {}, {})
+
+        array_columns: Dict[str, Dict[Tuple[str, ...], _ArrayColumn]] = {}
+        for name, arrays_by_path in leaves.items():
+            array_columns[name] = {}
+            for path, arrays in arrays_by_path.items():
+                if len({array.ndim for array in arrays}) != 1:
+                    raise ValueError(f"Field {name} has arrays of different ranks.")
+                padding_value = padding_values[name]
+                sizes = numpy.fromiter(
+                    (array.size for array in arrays),
+                    dtype=numpy.int64,
+                    count=len(arrays),
+                )
+                offsets = numpy.zeros(len(arrays) + 1, dtype=numpy.int64)
+                numpy.cumsum(sizes, out=offsets[1:])
+                array_columns[name][path] = _ArrayColumn(
+                    numpy.concatenate([array.ravel() for array in arrays]),
+                    offsets,
+                    numpy.array(
+                        [array.shape for array in arrays], dtype=numpy.int64
+                    ).reshape(len(arrays), arrays[0].ndim),
+                    padding_value.get(path[0], 0) if path else padding_value[""],
+                )
+                arrays.clear()
+        return cls(
+            length,
+            array_columns,
+            cast(Mapping[str, Sequence[Field]], object_columns),
+            prototypes,
+        )
@@ -1,29 +1,37 @@
 from collatable.fields.adjacency_field import AdjacencyField
+from collatable.fields.enumerated_spans_field import EnumeratedSpansField
 from collatable.fields.field import Field
 from collatable.fields.index_field import IndexField
 from collatable.fields.label_field import LabelField
 from collatable.fields.list_field import ListField
 from collatable.fields.mapping_field import MappingField
+from collatable.fields.memmap_tensor_field import MemmapTensorField
 from collatable.fields.metadata_field import MetadataField
+from collatable.fields.multi_label_field import MultiLabelField
 from collatable.fields.scalar_field import ScalarField
 from collatable.fields.sequence_field import SequenceField
 from collatable.fields.sequence_label_field import SequenceLabelField
 from collatable.fields.span_field import SpanField
+from collatable.fields.sparse_adjacency_field import SparseAdjacencyField
 from collatable.fields.tensor_field import TensorField
 from collatable.fields.text_field import TextField
 
 __all__ = [
     "AdjacencyField",
+    "EnumeratedSpansField",
     "Field",
     "IndexField",
     "LabelField",
     "ListField",
     "MappingField",
+    "MemmapTensorField",
     "MetadataField",
+    "MultiLabelField",
     "ScalarField",
     "SequenceField",
     "SequenceLabelField",
     "SpanField",
+    "SparseAdjacencyField",
     "TensorField",
     "TextField",
 ]
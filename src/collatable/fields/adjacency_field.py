@@ -13,10 +13,12 @@ from typing import (
 )
 
 import numpy
+from numpy.typing import DTypeLike
 
 from collatable.fields.field import Field, PaddingValue
 from collatable.fields.sequence_field import SequenceField
 from collatable.types import IntTensor
+from collatable.utils import cast_indices, is_training_indexer
 
 Self = TypeVar("Self", bound="AdjacencyField")
 LabelT = TypeVar("LabelT", bound=Hashable)
@@ -33,9 +35,12 @@ class AdjacencyField(Generic[LabelT], Field[IntTensor]):
         "_indices",
         "_labels",
         "_indexed_labels",
+        "_indexer",
         "_sequence_length",
         "_padding_value",
+        "_dtype",
     ]
+    _SLOT_DEFAULTS = {"_indexer": None, "_dtype": numpy.dtype(numpy.int_)}
 
     def __init__(
         self,
@@ -46,16 +51,14 @@ class AdjacencyField(Generic[LabelT], Field[IntTensor]):
         vocab: Optional[Mapping[LabelT, int]] = None,
         indexer: Optional[Callable[[LabelT], int]] = None,
         padding_value: PaddingValue = -1,
+        lazy: bool = False,
+        dtype: DTypeLike = numpy.int_,
     ) -> None:
         if len(indices) == 0:
             raise ValueError("AdjacencyField requires at least one index.")
         if labels is not None and len(indices) != len(labels):
             raise ValueError("AdjacencyField requires a label for every index.")
-        if (
-            labels is not None
-            and (vocab is None is indexer)
-            or (vocab is not None and indexer is not None)
-        ):
+        if vocab is not None and indexer is not None:
             raise ValueError("Must specify either vocab or indexer.")
         if (
             labels is not None
@@ -65,20 +68,26 @@ class AdjacencyField(Generic[LabelT], Field[IntTensor]):
             raise ValueError("Vocab or indexer must be specified if label is a string.")
         if labels is not None and isinstance(labels[0], str) and vocab is not None:
             indexer = self._make_indexer(vocab)
-        if not all(
-            0 <= index < len(sequence_field) for pair in indices for index in pair
-        ):
+        edges = numpy.asarray(indices, dtype=numpy.int64).reshape(-1, 2)
+        if edges.min() < 0 or edges.max() >= len(sequence_field):
             raise ValueError("Indices must be within the bounds of the sequence.")
 
+        if lazy and is_training_indexer(indexer):
+            raise ValueError("Lazy indexing requires a frozen indexer.")
+
         super().__init__(padding_value=padding_value)
 
         self._indices = indices
         self._labels = labels
         self._sequence_length = len(sequence_field)
-        self._indexed_labels: Optional[Sequence[int]]
+        self._dtype = numpy.dtype(dtype)
+        self._indexed_labels: Optional[Sequence[int]] = None
+        self._indexer: Optional[Callable[[LabelT], int]] = None
         if self._labels:
-            if isinstance(self._labels[0], int):
+            if isinstance(self._labels[0], (int, numpy.integer)):
                 self._indexed_labels = cast(Sequence[int], self._labels)
+            elif lazy:
+                self._indexer = indexer
             else:
                 assert indexer is not None
                 self._indexed_labels = [indexer(label) for label in self._labels]
@@ -96,20 +105,30 @@ class AdjacencyField(Generic[LabelT], Field[IntTensor]):
 
         return indexer
 
+    def _materialize(self) -> None:
+        if self._indexer is not None:
+            assert self._labels is not None
+            self._indexed_labels = [self._indexer(label) for label in self._labels]
+            self._indexer = None
+
     def as_array(self) -> IntTensor:
-        array: IntTensor = numpy.full(
-            (self._sequence_length, self._sequence_length),
-            self.padding_value[""],
-            dtype=numpy.int_,
+        self._materialize()
+        array = cast(
+            IntTensor,
+            numpy.full(
+                (self._sequence_length, self._sequence_length),
+                self.padding_value[""],
+                dtype=self._dtype,
+            ),
         )
-        labels = (
-            self._indexed_labels
-            if self._labels is not None
-            else [1] * len(self._indices)
+        edges = numpy.asarray(self._indices, dtype=numpy.int64).reshape(-1, 2)
+        array[edges[:, 0], edges[:, 1]] = (
+            cast_indices(
+                numpy.asarray(self._indexed_labels, dtype=numpy.int64), self._dtype
+            )
+            if self._indexed_labels is not None
+            else 1
         )
-        assert labels is not None
-        for (i, j), label in zip(self._indices, labels):
-            array[i, j] = label
         return array
 
     @classmethod
@@ -125,15 +144,78 @@ class AdjacencyField(Generic[LabelT], Field[IntTensor]):
             raise ValueError(
                 f"AdjacencyField expects a 2-dimensional array, but got shape {array.shape}"
             )
-        indices = []
-        indexed_labels: List[LabelT] = []
-        for i, row in enumerate(array):
-            for j, label in enumerate(row):
-                if label != padding_value:
-                    indices.append((i, j))
-                    if indexer is not None:
-                        indexed_labels.append(indexer.decode(label))
-
-        return cls(
-            indices, sequence_field, labels=indexed_labels, padding_value=padding_value
+        rows, cols = numpy.nonzero(array != padding_value)
+        return cls._from_indexed_labels(
+            rows,
+            cols,
+            sequence_field,
+            array[rows, cols],
+            indexer=indexer,
+            padding_value=padding_value,
         )
+
+    @classmethod
+    def from_batch_array(
+        cls,
+        array: IntTensor,
+        *,
+        sequence_fields: Sequence[SequenceField],
+        indexer: Optional[IDecotableIndexer[LabelT]] = None,
+        padding_value: PaddingValue = -1,
+    ) -> List["AdjacencyField[LabelT]"]:
+        if array.ndim != 3:
+            raise ValueError(
+                f"AdjacencyField expects a 3-dimensional batch array, but got shape {array.shape}"
+            )
+        if len(array) != len(sequence_fields):
+            raise ValueError("Batch size does not match the number of sequence fields.")
+        batch_ids, rows, cols = numpy.nonzero(array != padding_value)
+        indexed_labels = array[batch_ids, rows, cols]
+        sections = numpy.searchsorted(batch_ids, numpy.arange(1, len(array))).tolist()
+        boundaries = [0, *sections, len(batch_ids)]
+        return [
+            cls._from_indexed_labels(
+                rows[start:end],
+                cols[start:end],
+                sequence_field,
+                indexed_labels[start:end],
+                indexer=indexer,
+                padding_value=padding_value,
+            )
+            for start, end, sequence_field in zip(
+                boundaries[:-1], boundaries[1:], sequence_fields
+            )
+        ]
+
+    @classmethod
+    def _from_indexed_labels(
+        cls,
+        rows: IntTensor,
+        cols: IntTensor,
+        sequence_field: SequenceField,
+        indexed_labels: IntTensor,
+        *,
+        indexer: Optional[IDecotableIndexer[LabelT]],
+        padding_value: PaddingValue,
+    ) -> "AdjacencyField[LabelT]":
+        if len(rows) > 0 and max(rows.max(), cols.max()) >= len(sequence_field):
+            raise ValueError("Indices must be within the bounds of the sequence.")
+        indices = cast(List[Tuple[int, int]], list(zip(rows.tolist(), cols.tolist())))
+        labels: Sequence[LabelT]
+        if indexer is None:
+            labels = cast(Sequence[LabelT], indexed_labels.tolist())
+        else:
+            get_values_by_indices = getattr(indexer, "get_values_by_indices", None)
+            if get_values_by_indices is not None:
+                labels = get_values_by_indices(indexed_labels).tolist()
+            else:
+                labels = [indexer.decode(index) for index in indexed_labels.tolist()]
+        field = cls.__new__(cls)
+        Field.__init__(field, padding_value=padding_value)
+        field._indices = indices
+        field._labels = labels
+        field._sequence_length = len(sequence_field)
+        field._dtype = numpy.dtype(numpy.int_)
+        field._indexed_labels = indexed_labels.tolist()
+        field._indexer = None
+        return field
@@ -0,0 +1,135 @@
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+import numpy
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class FrozenDict(Dict[str, Any]):
+    def _readonly(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError("Cached arrays are read-only.")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly  # type: ignore[assignment]
+    clear = pop = popitem = setdefault = update = _readonly  # type: ignore[assignment]
+
+    def __reduce__(self) -> Tuple[type, Tuple[Dict[str, Any]]]:
+        return dict, (dict(self),)
+
+
+def _collect_arrays(array: Any, arrays: Dict[int, numpy.ndarray]) -> None:
+    if isinstance(array, numpy.ndarray):
+        arrays[id(array)] = array
+    elif isinstance(array, Mapping):
+        for value in array.values():
+            _collect_arrays(value, arrays)
+    elif isinstance(array, Sequence) and not isinstance(array, (str, bytes)):
+        for value in array:
+            _collect_arrays(value, arrays)
+
+
+def _freeze(array: Any) -> None:
+    if isinstance(array, numpy.ndarray):
+        array.flags.writeable = False
+    elif isinstance(array, Mapping):
+        for value in array.values():
+            _freeze(value)
+
+
+class ArrayCache:
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[int, Tuple[weakref.ref, Any, Tuple[int, ...]]]" = (
+            OrderedDict()
+        )
+        self._array_refcounts: Dict[int, int] = {}
+        self._array_nbytes: Dict[int, int] = {}
+        self._currsize = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.RLock()
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    def get(self, obj: object) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(id(obj))
+            if entry is None or entry[0]() is not obj:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(id(obj))
+            self._hits += 1
+            return entry[1]
+
+    def put(self, obj: object, array: Any, *, owned: bool = True) -> None:
+        arrays: Dict[int, numpy.ndarray] = {}
+        if owned:
+            _collect_arrays(array, arrays)
+            if sum(value.nbytes for value in arrays.values()) > self._maxsize:
+                return
+            _freeze(array)
+        key = id(obj)
+
+        def discard(ref: weakref.ref) -> None:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] is ref:
+                    self._pop(key)
+
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = (weakref.ref(obj, discard), array, tuple(arrays))
+            for array_id, value in arrays.items():
+                if array_id not in self._array_refcounts:
+                    self._array_refcounts[array_id] = 0
+                    self._array_nbytes[array_id] = value.nbytes
+                    self._currsize += value.nbytes
+                self._array_refcounts[array_id] += 1
+            self._evict()
+
+    def resize(self, maxsize: int) -> None:
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._maxsize, self._currsize)
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._array_refcounts.clear()
+            self._array_nbytes.clear()
+            self._currsize = 0
+            self._hits = 0
+            self._misses = 0
+
+    def _pop(self, key: int) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._release(entry[2])
+
+    def _release(self, array_ids: Tuple[int, ...]) -> None:
+        for array_id in array_ids:
+            self._array_refcounts[array_id] -= 1
+            if self._array_refcounts[array_id] == 0:
+                del self._array_refcounts[array_id]
+                self._currsize -= self._array_nbytes.pop(array_id)
+
+    def _evict(self) -> None:
+        while self._currsize > self._maxsize:
+            _, (_, _, array_ids) = self._entries.popitem(last=False)
+            self._release(array_ids)
+
+
+array_cache = ArrayCache(maxsize=128 * 1024 * 1024)
@@ -0,0 +1,251 @@
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Mapping,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
+
+import numpy
+
+from collatable.fields.field import Field, PaddingValue
+from collatable.fields.sequence_field import SequenceField
+from collatable.types import IntTensor
+
+LabelT = TypeVar("LabelT", bound=Hashable)
+
+
+class IDecotableIndexer(Protocol[LabelT]):
+    def __call__(self, label: LabelT) -> int: ...
+
+    def decode(self, index: int) -> LabelT: ...
+
+
+def _count_spans(length: IntTensor, max_width: int) -> IntTensor:
+    width = numpy.minimum(length, max_width)
+    return width * length - width * (width - 1) // 2
+
+
+def _enumerate_spans(length: int, max_width: int) -> IntTensor:
+    ends = numpy.broadcast_to(numpy.arange(1, length + 1)[:, None], (length, max_width))
+    starts = ends - numpy.arange(max_width, 0, -1)
+    valid = starts >= 0
+    return numpy.stack([starts[valid], ends[valid]], axis=-1)
+
+
+def _get_span_positions(
+    starts: IntTensor, ends: IntTensor, max_width: int
+) -> IntTensor:
+    return (
+        _count_spans(ends - 1, max_width) + starts - numpy.maximum(0, ends - max_width)
+    )
+
+
+class EnumeratedSpansField(Generic[LabelT], Field[Mapping[str, numpy.ndarray]]):
+    __slots__ = [
+        "_length",
+        "_max_width",
+        "_labels",
+        "_label_positions",
+        "_label_ids",
+        "_null_label_id",
+        "_padding_value",
+    ]
+
+    def __init__(
+        self,
+        sequence_field: SequenceField,
+        max_width: int,
+        *,
+        labels: Optional[Mapping[Tuple[int, int], LabelT]] = None,
+        vocab: Optional[Mapping[LabelT, int]] = None,
+        indexer: Optional[Callable[[LabelT], int]] = None,
+        null_label: Optional[LabelT] = None,
+        padding_value: Optional[PaddingValue] = None,
+    ) -> None:
+        if max_width < 1:
+            raise ValueError(f"max_width must be positive, but got {max_width}")
+        if vocab is not None and indexer is not None:
+            raise ValueError("Must specify either vocab or indexer.")
+        if vocab is not None:
+            indexer = self._make_indexer(vocab)
+
+        super().__init__(
+            padding_value={"spans": -1, "labels": -1}
+            if padding_value is None
+            else padding_value
+        )
+
+        self._length = sequence_field.get_truncated_position(len(sequence_field))
+        self._max_width = max_width
+        self._labels: Optional[Dict[Tuple[int, int], LabelT]] = None
+        self._label_positions: Optional[IntTensor] = None
+        self._label_ids: Optional[IntTensor] = None
+        self._null_label_id = 0
+        if labels is None:
+            return
+
+        span_labels = dict(labels)
+        self._labels = span_labels
+        if null_label is not None:
+            self._null_label_id = (
+                indexer(null_label) if indexer is not None else cast(int, null_label)
+            )
+        starts, ends, label_ids = [], [], []
+        for (start, end), label in span_labels.items():
+            if not 0 <= start < end <= len(sequence_field):
+                raise ValueError(f"Invalid span ({start}, {end}).")
+            if end - start > max_width:
+                raise ValueError(
+                    f"Span ({start}, {end}) is wider than max_width={max_width}."
+                )
+            if not isinstance(label, int):
+                if indexer is None:
+                    raise ValueError("Indexer must be specified if labels are strings.")
+                label = indexer(label)
+            start = sequence_field.get_truncated_position(start)
+            end = sequence_field.get_truncated_position(end)
+            starts.append(start)
+            ends.append(end)
+            label_ids.append(label)
+
+        starts_array = numpy.array(starts, dtype=numpy.int64)
+        ends_array = numpy.array(ends, dtype=numpy.int64)
+        kept = (ends_array - starts_array) == numpy.array(
+            [end - start for start, end in span_labels], dtype=numpy.int64
+        )
+        self._label_positions = _get_span_positions(
+            starts_array[kept], ends_array[kept], max_width
+        )
+        self._label_ids = numpy.array(label_ids, dtype=numpy.int64)[kept]
+
+    def __len__(self) -> int:
+        return int(_count_spans(numpy.array(self._length), self._max_width))
+
+    def __str__(self) -> str:
+        return f"EnumeratedSpans(length={self._length}, max_width={self._max_width})"
+
+    def __repr__(self) -> str:
+        return (
+            f"EnumeratedSpansField(length={self._length}, max_width={self._max_width}, "
+            f"labels={self._labels}, padding_value={self._padding_value})"
+        )
+
+    @property
+    def max_width(self) -> int:
+        return self._max_width
+
+    @property
+    def labels(self) -> Optional[Mapping[Tuple[int, int], LabelT]]:
+        return self._labels
+
+    def as_array(self) -> Mapping[str, numpy.ndarray]:
+        return {key: value[0] for key, value in self.collate([self]).items()}
+
+    def collate(  # type: ignore[override]
+        self,
+        arrays: Union[
+            Sequence[Mapping[str, numpy.ndarray]],
+            Sequence["EnumeratedSpansField[LabelT]"],
+        ],
+    ) -> Mapping[str, numpy.ndarray]:
+        if not isinstance(arrays[0], EnumeratedSpansField):
+            return super().collate(arrays)  # type: ignore[arg-type]
+        fields = cast(Sequence[EnumeratedSpansField[LabelT]], arrays)
+        max_width = fields[0]._max_width
+        if any(field._max_width != max_width for field in fields):
+            raise ValueError("EnumeratedSpansField requires the same max_width.")
+
+        lengths = numpy.fromiter(
+            (field._length for field in fields), dtype=numpy.int64, count=len(fields)
+        )
+        counts = _count_spans(lengths, max_width)
+        spans = _enumerate_spans(int(lengths.max()), max_width)
+        mask = numpy.arange(len(spans)) < counts[:, None]
+        output: Dict[str, numpy.ndarray] = {
+            "spans": numpy.where(
+                mask[:, :, None], spans, self.padding_value.get("spans", 0)
+            ),
+            "mask": mask,
+        }
+
+        labeled = [field for field in fields if field._label_ids is not None]
+        if labeled:
+            null_label_ids = numpy.fromiter(
+                (field._null_label_id for field in fields),
+                dtype=numpy.int64,
+                count=len(fields),
+            )
+            labels = numpy.where(
+                mask, null_label_ids[:, None], self.padding_value.get("labels", 0)
+            )
+            rows = numpy.repeat(
+                numpy.arange(len(fields)),
+                [
+                    0 if field._label_ids is None else len(field._label_ids)
+                    for field in fields
+                ],
+            )
+            labels[
+                rows,
+                numpy.concatenate(
+                    [cast(IntTensor, field._label_positions) for field in labeled]
+                ),
+            ] = numpy.concatenate(
+                [cast(IntTensor, field._label_ids) for field in labeled]
+            )
+            output["labels"] = labels
+        return output
+
+    @classmethod
+    def from_array(  # type: ignore[override]
+        cls,
+        array: Mapping[str, numpy.ndarray],
+        *,
+        sequence_field: SequenceField,
+        max_width: int,
+        indexer: Optional[IDecotableIndexer[LabelT]] = None,
+        null_label: Optional[LabelT] = None,
+    ) -> "EnumeratedSpansField[LabelT]":
+        if array["spans"].ndim != 2 or array["spans"].shape[1] != 2:
+            raise ValueError(
+                f"EnumeratedSpansField expects spans of shape (S, 2), but got {array['spans'].shape}"
+            )
+        if "labels" not in array:
+            return cls(sequence_field, max_width)
+        null_label_id = 0
+        if null_label is not None:
+            null_label_id = (
+                indexer(null_label) if indexer is not None else cast(int, null_label)
+            )
+        labels: Dict[Tuple[int, int], LabelT] = {}
+        for (start, end), label_id, valid in zip(
+            array["spans"].tolist(), array["labels"].tolist(), array["mask"].tolist()
+        ):
+            if valid and label_id != null_label_id:
+                labels[(start, end)] = (
+                    indexer.decode(label_id)
+                    if indexer is not None
+                    else cast(LabelT, label_id)
+                )
+        return cls(
+            sequence_field,
+            max_width,
+            labels=labels,
+            indexer=indexer,
+            null_label=null_label,
+        )
+
+    @staticmethod
+    def _make_indexer(vocab: Mapping[LabelT, int]) -> Callable[[LabelT], int]:
+        def indexer(label: LabelT) -> int:
+            return vocab[label]
+
+        return indexer
@@ -1,6 +1,20 @@
 import abc
 import copy
-from typing import Any, Dict, Generic, List, Sequence, Type, TypeVar, Union, cast
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Generic,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 import numpy
 
@@ -11,8 +25,30 @@ Self = TypeVar("Self", bound="Field")
 PaddingValue = Union[Dict[str, ArrayLike], ArrayLike]
 
 
+def _copy_value(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+        return value
+    if isinstance(value, numpy.ndarray):
+        value.flags.writeable = False
+        return value
+    if isinstance(value, Field):
+        return value.copy()
+    if isinstance(value, list):
+        return [_copy_value(item) for item in value]
+    if type(value) is tuple:
+        return tuple(_copy_value(item) for item in value)
+    if type(value) is dict:
+        return {key: _copy_value(item) for key, item in value.items()}
+    if callable(value) or isinstance(value, numpy.dtype):
+        return value
+    return copy.deepcopy(value)
+
+
 class Field(abc.ABC, Generic[DataArrayT]):
     __slots__: List[str]
+    # Values for slots added after a field type was first released, so that
+    # fields pickled by older versions (e.g. stored datasets) still load.
+    _SLOT_DEFAULTS: ClassVar[Mapping[str, Any]] = {}
 
     def __init__(self, padding_value: PaddingValue = 0) -> None:
         if not isinstance(padding_value, dict):
@@ -22,6 +58,8 @@ class Field(abc.ABC, Generic[DataArrayT]):
 
     def __eq__(self, other: object) -> bool:
         if isinstance(self, other.__class__):
+            self._materialize()
+            cast(Field, other)._materialize()
             for cls in self.__class__.mro():
                 for attr in getattr(cls, "__slots__", []):
                     if getattr(self, attr) != getattr(other, attr):
@@ -31,10 +69,38 @@ class Field(abc.ABC, Generic[DataArrayT]):
             return True
         return NotImplemented
 
+    def __getstate__(self) -> Tuple[Optional[Dict[str, Any]], Dict[str, Any]]:
+        self._materialize()
+        slots = {
+            attr: getattr(self, attr)
+            for cls in self.__class__.mro()
+            for attr in getattr(cls, "__slots__", [])
+            if hasattr(self, attr)
+        }
+        return getattr(self, "__dict__", None) or None, slots
+
+    def __setstate__(
+        self, state: Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]
+    ) -> None:
+        dict_state, slots = state if isinstance(state, tuple) else (state, None)
+        for key, value in {**(dict_state or {}), **(slots or {})}.items():
+            setattr(self, key, value)
+        for cls in self.__class__.mro():
+            for attr, value in getattr(cls, "_SLOT_DEFAULTS", {}).items():
+                if not hasattr(self, attr):
+                    setattr(self, attr, value)
+
+    def _materialize(self) -> None:
+        pass
+
     @property
     def padding_value(self) -> Dict[str, ArrayLike]:
         return self._padding_value
 
+    @classmethod
+    def _has_padded_collate(cls) -> bool:
+        return cls.collate is Field.collate
+
     def collate(
         self: Self, arrays: Union[Sequence[DataArrayT], Sequence[Self]]
     ) -> DataArrayT:
@@ -61,8 +127,17 @@ class Field(abc.ABC, Generic[DataArrayT]):
             }
         raise TypeError(f"Unsupported type: {type(arrays[0])}")
 
-    def copy(self: Self) -> Self:
-        return copy.deepcopy(self)
+    def copy(self: Self, *, deep: bool = False) -> Self:
+        if deep:
+            return copy.deepcopy(self)
+        output = self.__class__.__new__(self.__class__)
+        for cls in self.__class__.mro():
+            for attr in getattr(cls, "__slots__", []):
+                if hasattr(self, attr):
+                    setattr(output, attr, _copy_value(getattr(self, attr)))
+        for key, value in getattr(self, "__dict__", {}).items():
+            setattr(output, key, _copy_value(value))
+        return output
 
     @abc.abstractmethod
     def as_array(self) -> DataArrayT:
@@ -1,3 +1,5 @@
+from typing import Any, Sequence, Union, cast
+
 import numpy
 
 from collatable.fields.field import Field
@@ -6,7 +8,7 @@ from collatable.types import IntTensor
 
 
 class IndexField(Field[IntTensor]):
-    __slots__ = ["_index"]
+    __slots__ = ["_index", "_truncated_index"]
 
     def __init__(self, index: int, sequence: SequenceField) -> None:
         if index < 0 or index >= len(sequence):
@@ -16,6 +18,17 @@ class IndexField(Field[IntTensor]):
 
         super().__init__(padding_value=-1)
         self._index = index
+        self._truncated_index = index
+        if sequence.max_length is not None:
+            position = sequence.get_truncated_position(index)
+            if position == sequence.get_truncated_position(index + 1):
+                position = -1
+            self._truncated_index = position
+
+    def __setstate__(self, state: Any) -> None:
+        super().__setstate__(state)
+        if not hasattr(self, "_truncated_index"):
+            self._truncated_index = self._index
 
     def __str__(self) -> str:
         return str(self._index)
@@ -28,7 +41,24 @@ class IndexField(Field[IntTensor]):
         return self._index
 
     def as_array(self) -> IntTensor:
-        return numpy.array(self.index)
+        return numpy.array(self._truncated_index)
+
+    @classmethod
+    def _has_padded_collate(cls) -> bool:
+        return True
+
+    def collate(  # type: ignore[override]
+        self,
+        arrays: Union[Sequence[IntTensor], Sequence["IndexField"]],
+    ) -> IntTensor:
+        if not isinstance(arrays[0], IndexField):
+            return super().collate(cast(Sequence[IntTensor], arrays))
+        fields = cast(Sequence[IndexField], arrays)
+        return numpy.fromiter(
+            (field._truncated_index for field in fields),
+            dtype=numpy.int_,
+            count=len(fields),
+        )
 
     @classmethod
     def from_array(  # type: ignore[override]
@@ -5,14 +5,18 @@ from typing import (
     Mapping,
     Optional,
     Protocol,
+    Sequence,
     TypeVar,
+    Union,
     cast,
 )
 
 import numpy
+from numpy.typing import DTypeLike
 
 from collatable.fields.field import Field
 from collatable.types import IntTensor
+from collatable.utils import cast_indices, is_training_indexer
 
 Self = TypeVar("Self", bound="LabelField")
 LabelT = TypeVar("LabelT", bound=Hashable)
@@ -25,7 +29,8 @@ class IDecotableIndexer(Protocol[LabelT]):
 
 
 class LabelField(Generic[LabelT], Field[IntTensor]):
-    __slots__ = ["_label", "_label_index"]
+    __slots__ = ["_label", "_label_index", "_indexer", "_dtype"]
+    _SLOT_DEFAULTS = {"_indexer": None, "_dtype": numpy.dtype(numpy.int_)}
 
     def __init__(
         self,
@@ -33,6 +38,8 @@ class LabelField(Generic[LabelT], Field[IntTensor]):
         *,
         vocab: Optional[Mapping[LabelT, int]] = None,
         indexer: Optional[Callable[[LabelT], int]] = None,
+        lazy: bool = False,
+        dtype: DTypeLike = numpy.int_,
     ) -> None:
         if isinstance(label, str) and vocab is None is indexer:
             raise ValueError("LabelField with string labels requires vocab or indexer")
@@ -42,11 +49,18 @@ class LabelField(Generic[LabelT], Field[IntTensor]):
             assert vocab is not None
             indexer = self._make_indexer(vocab)
 
+        if lazy and is_training_indexer(indexer):
+            raise ValueError("Lazy indexing requires a frozen indexer.")
+
         super().__init__()
         self._label = label
-        self._label_index: int
+        self._label_index: Optional[int] = None
+        self._indexer: Optional[Callable[[LabelT], int]] = None
+        self._dtype = numpy.dtype(dtype)
         if isinstance(label, int):
             self._label_index = label
+        elif lazy:
+            self._indexer = indexer
         else:
             assert indexer is not None
             self._label_index = indexer(label)
@@ -61,8 +75,42 @@ class LabelField(Generic[LabelT], Field[IntTensor]):
     def label(self) -> LabelT:
         return self._label
 
+    def _materialize(self) -> None:
+        if self._indexer is not None:
+            self._label_index = self._indexer(self._label)
+            self._indexer = None
+
     def as_array(self) -> IntTensor:
-        return numpy.array(self._label_index, dtype=numpy.int_)
+        self._materialize()
+        return cast_indices(
+            cast(IntTensor, numpy.array(self._label_index, dtype=numpy.int64)),
+            self._dtype,
+        )
+
+    @classmethod
+    def _has_padded_collate(cls) -> bool:
+        return True
+
+    def collate(  # type: ignore[override]
+        self,
+        arrays: Union[Sequence[IntTensor], Sequence["LabelField[LabelT]"]],
+    ) -> IntTensor:
+        if not isinstance(arrays[0], LabelField):
+            return super().collate(cast(Sequence[IntTensor], arrays))
+        fields = cast(Sequence[LabelField[LabelT]], arrays)
+        for field in fields:
+            field._materialize()
+        return cast_indices(
+            cast(
+                IntTensor,
+                numpy.fromiter(
+                    (field._label_index for field in fields),
+                    dtype=numpy.int64,
+                    count=len(fields),
+                ),
+            ),
+            self._dtype,
+        )
 
     @classmethod
     def from_array(  # type: ignore[override]
@@ -1,8 +1,50 @@
-from typing import Generic, Iterator, Optional, Sequence, Type
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
+import numpy
+
+from collatable.fields.array_cache import array_cache
 from collatable.fields.field import Field, PaddingValue
-from collatable.fields.sequence_field import SequenceField
-from collatable.types import DataArrayT
+from collatable.fields.sequence_field import SequenceField, TruncationStrategy
+from collatable.types import ArrayLike, DataArrayT, Tensor
+
+
+def _is_same_padding_value(
+    first: Mapping[str, ArrayLike], second: Mapping[str, ArrayLike]
+) -> bool:
+    return first is second or (
+        first.keys() == second.keys()
+        and all(numpy.array_equal(first[key], second[key]) for key in first)
+    )
+
+
+def _fill_with_padding(
+    paths: Sequence[Tuple[int, ...]],
+    leaves: Sequence[Tensor],
+    shape: Tuple[int, ...],
+    padding_value: ArrayLike,
+) -> Tensor:
+    if leaves[0].ndim == 0:
+        dtype = numpy.result_type(*leaves)
+    else:
+        dtype = leaves[0].dtype
+    max_shape = tuple(max(dims) for dims in zip(*(leaf.shape for leaf in leaves)))
+    output = numpy.full((*shape, *max_shape), padding_value, dtype=dtype)
+    for path, leaf in zip(paths, leaves):
+        output[path + tuple(map(slice, leaf.shape))] = leaf
+    return output
 
 
 class ListField(Generic[DataArrayT], SequenceField[DataArrayT]):
@@ -12,13 +54,18 @@ class ListField(Generic[DataArrayT], SequenceField[DataArrayT]):
         self,
         fields: Sequence[Field[DataArrayT]],
         padding_value: Optional[PaddingValue] = None,
+        *,
+        max_length: Optional[int] = None,
+        truncation: TruncationStrategy = "head",
     ) -> None:
         super().__init__(
             padding_value=padding_value
             if padding_value is not None
-            else fields[0].padding_value
+            else fields[0].padding_value,
+            max_length=max_length,
+            truncation=truncation,
         )
-        self._fields: Sequence[Field[DataArrayT]] = fields
+        self._fields: Sequence[Field[DataArrayT]] = tuple(fields)
 
     def __len__(self) -> int:
         return len(self.fields)
@@ -40,7 +87,87 @@ class ListField(Generic[DataArrayT], SequenceField[DataArrayT]):
         return self._fields
 
     def as_array(self) -> DataArrayT:
-        return self.fields[0].collate(self.fields)
+        cached = array_cache.get(self)
+        if cached is not None:
+            return cached
+        output = self._collate_nested([self])
+        if output is None:
+            # custom collates may hand back their items' buffers, so only the
+            # arrays padded here are cached
+            fields = self.truncate(self.fields)
+            return fields[0].collate(fields)
+        if isinstance(output, dict):
+            array = cast(DataArrayT, {key: value[0] for key, value in output.items()})
+        else:
+            array = cast(DataArrayT, output[0])
+        array_cache.put(self, array)
+        return array
+
+    def collate(  # type: ignore[override]
+        self,
+        arrays: Union[Sequence[DataArrayT], Sequence["ListField[DataArrayT]"]],
+    ) -> DataArrayT:
+        if isinstance(arrays[0], ListField):
+            output = self._collate_nested(cast(Sequence[ListField], arrays))
+            if output is not None:
+                return cast(DataArrayT, output)
+        return super().collate(arrays)  # type: ignore[arg-type]
+
+    @staticmethod
+    def _collate_nested(
+        fields: Sequence["ListField"],
+    ) -> Optional[Union[Tensor, Dict[str, Tensor]]]:
+        padding_value = fields[0].padding_value
+        lengths: List[int] = [len(fields)]
+        paths: List[Tuple[int, ...]] = []
+        leaves: List[Field] = []
+
+        def gather(field: Field, path: Tuple[int, ...]) -> bool:
+            if not _is_same_padding_value(field.padding_value, padding_value):
+                return False
+            if not isinstance(field, ListField):
+                if not field._has_padded_collate():
+                    return False
+                paths.append(path)
+                leaves.append(field)
+                return True
+            if len(lengths) == len(path):
+                lengths.append(0)
+            items = field.truncate(field.fields)
+            lengths[len(path)] = max(lengths[len(path)], len(items))
+            return all(gather(item, (*path, index)) for index, item in enumerate(items))
+
+        if not all(gather(field, (index,)) for index, field in enumerate(fields)):
+            return None
+        if any(len(path) != len(lengths) for path in paths):
+            return None
+
+        arrays: List[Any] = [leaf.as_array() for leaf in leaves]
+        shape = tuple(lengths)
+        if all(isinstance(array, numpy.ndarray) for array in arrays):
+            if len({array.ndim for array in arrays}) != 1:
+                return None
+            return _fill_with_padding(paths, arrays, shape, padding_value[""])
+        if all(isinstance(array, dict) for array in arrays):
+            keys = arrays[0].keys()
+            if any(
+                array.keys() != keys
+                or not all(isinstance(value, numpy.ndarray) for value in array.values())
+                for array in arrays
+            ):
+                return None
+            if any(len({array[key].ndim for array in arrays}) != 1 for key in keys):
+                return None
+            return {
+                key: _fill_with_padding(
+                    paths,
+                    [array[key] for array in arrays],
+                    shape,
+                    padding_value.get(key, 0),
+                )
+                for key in keys
+            }
+        return None
 
     @classmethod
     def from_array(  # type: ignore[override]
@@ -12,6 +12,7 @@ from typing import (
     cast,
 )
 
+from collatable.fields.array_cache import FrozenDict, array_cache
 from collatable.fields.field import Field
 from collatable.types import DataArray, DataArrayT
 
@@ -26,7 +27,7 @@ class MappingField(
 ):
     def __init__(self, mapping: Mapping[str, FieldT]) -> None:
         super().__init__()
-        self._mapping = mapping
+        self._mapping: Mapping[str, FieldT] = dict(mapping)
 
     def __len__(self) -> int:
         return len(self._mapping)
@@ -47,7 +48,15 @@ class MappingField(
         return f"MappingField({self._mapping})"
 
     def as_array(self) -> Dict[str, Any]:
-        return {key: field.as_array() for key, field in self._mapping.items()}
+        cached = array_cache.get(self)
+        if cached is not None:
+            return cached
+        array = FrozenDict(
+            (key, field.as_array()) for key, field in self._mapping.items()
+        )
+        # the values belong to the child fields and are neither frozen nor counted
+        array_cache.put(self, array, owned=False)
+        return array
 
     @classmethod
     def from_array(  # type: ignore[override]
@@ -70,9 +79,10 @@ class MappingField(
         if not isinstance(arrays[0], MappingField):
             arrays = cast(Sequence[Dict[str, DataArrayT]], arrays)
             return super().collate(arrays)
-        return {
-            key: field.collate(
-                [x[key] for x in (x.as_array() for x in cast(Sequence[Self], arrays))]
-            )
-            for key, field in cast(MappingField, self)._mapping.items()
-        }
+        return dict(cast(MappingField, self).iter_collate(cast(Sequence, arrays)))
+
+    def iter_collate(
+        self, fields: Sequence["MappingField[DataArrayT, FieldT]"]
+    ) -> Iterator[Tuple[str, DataArrayT]]:
+        for key, field in self._mapping.items():
+            yield key, field.collate([x._mapping[key] for x in fields])
@@ -0,0 +1,120 @@
+import mmap
+import os
+from typing import Sequence, Tuple, Union, cast
+
+import numpy
+from numpy.lib import format as npy_format
+from numpy.typing import DTypeLike
+
+from collatable.fields.field import Field
+from collatable.types import ArrayLike, Tensor
+
+
+class MemmapTensorField(Field[Tensor]):
+    __slots__ = ["_path", "_shape", "_dtype", "_offset", "_fortran_order"]
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        shape: Sequence[int],
+        dtype: DTypeLike,
+        *,
+        offset: int = 0,
+        fortran_order: bool = False,
+        padding_value: ArrayLike = 0,
+    ) -> None:
+        super().__init__(padding_value=padding_value)
+        self._path = os.fspath(path)
+        self._shape: Tuple[int, ...] = tuple(shape)
+        self._dtype = numpy.dtype(dtype)
+        self._offset = offset
+        self._fortran_order = fortran_order
+
+    def __str__(self) -> str:
+        return f"{self._path}[{self._offset}]"
+
+    def __repr__(self) -> str:
+        return (
+            f"MemmapTensorField(path={self._path!r}, shape={self._shape}, "
+            f"dtype={self._dtype}, offset={self._offset})"
+        )
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self._shape
+
+    @property
+    def dtype(self) -> numpy.dtype:
+        return self._dtype
+
+    def _load(self) -> Tensor:
+        if 0 in self._shape:
+            return numpy.empty(self._shape, dtype=self._dtype)
+        return numpy.memmap(
+            self._path,
+            dtype=self._dtype,
+            mode="r",
+            offset=self._offset,
+            shape=self._shape,
+            order="F" if self._fortran_order else "C",
+        )
+
+    def as_array(self) -> Tensor:
+        return numpy.array(self._load())
+
+    def collate(  # type: ignore[override]
+        self,
+        arrays: Union[Sequence[Tensor], Sequence["MemmapTensorField"]],
+    ) -> Tensor:
+        if not isinstance(arrays[0], MemmapTensorField):
+            return super().collate(cast(Sequence[Tensor], arrays))
+        fields = cast(Sequence[MemmapTensorField], arrays)
+        max_shape = tuple(
+            max(dims) for dims in zip(*(field._shape for field in fields))
+        )
+        output = numpy.full(
+            (len(fields), *max_shape), self.padding_value[""], dtype=fields[0]._dtype
+        )
+        for index, field in enumerate(fields):
+            output[(index, *map(slice, field._shape))] = field._load()
+        return output
+
+    @classmethod
+    def from_npy(
+        cls,
+        path: Union[str, "os.PathLike[str]"],
+        *,
+        padding_value: ArrayLike = 0,
+    ) -> "MemmapTensorField":
+        with open(path, "rb") as file:
+            version = npy_format.read_magic(file)
+            if version == (1, 0):
+                shape, fortran_order, dtype = npy_format.read_array_header_1_0(file)
+            else:
+                shape, fortran_order, dtype = npy_format.read_array_header_2_0(file)
+            offset = file.tell()
+        return cls(
+            path,
+            shape,
+            dtype,
+            offset=offset,
+            fortran_order=fortran_order,
+            padding_value=padding_value,
+        )
+
+    @classmethod
+    def from_array(cls, array: Tensor) -> "MemmapTensorField":  # type: ignore[override]
+        if not isinstance(array, numpy.memmap) or not isinstance(array.base, mmap.mmap):
+            raise ValueError("MemmapTensorField requires an unsliced numpy.memmap.")
+        assert array.filename is not None
+        return cls(
+            array.filename,
+            array.shape,
+            array.dtype,
+            offset=array.offset,
+            fortran_order=not array.flags.c_contiguous and array.flags.f_contiguous,
+        )
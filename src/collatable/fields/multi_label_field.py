@@ -0,0 +1,138 @@
+import itertools
+from typing import (
+    Callable,
+    Generic,
+    Hashable,
+    Mapping,
+    Optional,
+    Protocol,
+    Sequence,
+    Sized,
+    TypeVar,
+    Union,
+    cast,
+)
+
+import numpy
+
+from collatable.fields.field import Field
+from collatable.types import BoolTensor
+
+Self = TypeVar("Self", bound="MultiLabelField")
+LabelT = TypeVar("LabelT", bound=Hashable)
+
+
+class IDecotableIndexer(Protocol[LabelT]):
+    def __call__(self, label: LabelT, /) -> int: ...
+
+    def decode(self, index: int, /) -> LabelT: ...
+
+
+class MultiLabelField(Generic[LabelT], Field[BoolTensor]):
+    __slots__ = ["_labels", "_label_indices", "_num_labels"]
+
+    def __init__(
+        self,
+        labels: Sequence[LabelT],
+        *,
+        num_labels: Optional[int] = None,
+        vocab: Optional[Mapping[LabelT, int]] = None,
+        indexer: Optional[Callable[[LabelT], int]] = None,
+    ) -> None:
+        if vocab is not None and indexer is not None:
+            raise ValueError("Must specify either vocab or indexer.")
+        if vocab is not None:
+            indexer = self._make_indexer(vocab)
+        if indexer is None and not all(isinstance(label, int) for label in labels):
+            raise ValueError(
+                "MultiLabelField with non-integer labels requires vocab or indexer"
+            )
+
+        label_indices = [
+            cast(int, label) if indexer is None else indexer(label) for label in labels
+        ]
+        if num_labels is None:
+            if vocab is not None:
+                num_labels = len(vocab)
+            elif isinstance(indexer, Sized):
+                if getattr(indexer, "training", False):
+                    raise ValueError(
+                        "MultiLabelField requires num_labels when the indexer "
+                        "is still training"
+                    )
+                num_labels = len(indexer)
+            else:
+                raise ValueError(
+                    "MultiLabelField requires num_labels unless vocab or "
+                    "a sized indexer is given"
+                )
+        if not all(0 <= index < num_labels for index in label_indices):
+            raise ValueError(f"Label indices must be within [0, {num_labels}).")
+
+        super().__init__(padding_value=False)
+        self._labels = labels
+        self._label_indices = label_indices
+        self._num_labels = num_labels
+
+    def __str__(self) -> str:
+        return f"[{', '.join(str(label) for label in self._labels)}]"
+
+    def __repr__(self) -> str:
+        return f"MultiLabelField(labels={self._labels}, num_labels={self._num_labels})"
+
+    @property
+    def labels(self) -> Sequence[LabelT]:
+        return self._labels
+
+    @property
+    def num_labels(self) -> int:
+        return self._num_labels
+
+    def as_array(self) -> BoolTensor:
+        array: BoolTensor = numpy.zeros(self._num_labels, dtype=bool)
+        array[self._label_indices] = True
+        return array
+
+    def collate(  # type: ignore[override]
+        self,
+        arrays: Union[Sequence[BoolTensor], Sequence["MultiLabelField[LabelT]"]],
+    ) -> BoolTensor:
+        if not isinstance(arrays[0], MultiLabelField):
+            return super().collate(cast(Sequence[BoolTensor], arrays))
+        fields = cast(Sequence[MultiLabelField[LabelT]], arrays)
+        lengths = numpy.fromiter(
+            (len(field._label_indices) for field in fields), dtype=numpy.int64
+        )
+        indices = numpy.fromiter(
+            itertools.chain.from_iterable(field._label_indices for field in fields),
+            dtype=numpy.int64,
+        )
+        num_labels = fields[0]._num_labels
+        if any(field._num_labels != num_labels for field in fields):
+            raise ValueError("MultiLabelField requires the same num_labels.")
+        output: BoolTensor = numpy.zeros((len(fields), num_labels), dtype=bool)
+        output[numpy.repeat(numpy.arange(len(fields)), lengths), indices] = True
+        return output
+
+    @classmethod
+    def from_array(  # type: ignore[override]
+        cls,
+        array: BoolTensor,
+        *,
+        indexer: Optional[IDecotableIndexer[LabelT]] = None,
+    ) -> "MultiLabelField[LabelT]":
+        if array.ndim != 1:
+            raise ValueError(
+                f"MultiLabelField expects a 1-dimensional array, but got shape {array.shape}"
+            )
+        labels = cast(Sequence[LabelT], numpy.flatnonzero(array).tolist())
+        if indexer is not None:
+            labels = [indexer.decode(index) for index in cast(Sequence[int], labels)]
+        return cls(labels, num_labels=len(array), indexer=indexer)
+
+    @staticmethod
+    def _make_indexer(vocab: Mapping[LabelT, int]) -> Callable[[LabelT], int]:
+        def indexer(label: LabelT) -> int:
+            return vocab[label]
+
+        return indexer
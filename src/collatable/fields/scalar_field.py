@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Sequence, Union, cast
 
 import numpy
 
@@ -29,6 +29,20 @@ class ScalarField(Field[Tensor]):
     def as_array(self) -> Tensor:
         return numpy.array(self._value)
 
+    @classmethod
+    def _has_padded_collate(cls) -> bool:
+        return True
+
+    def collate(  # type: ignore[override]
+        self,
+        arrays: Union[Sequence[Tensor], Sequence["ScalarField"]],
+    ) -> Tensor:
+        if not isinstance(arrays[0], ScalarField):
+            return super().collate(cast(Sequence[Tensor], arrays))
+        values = [field._value for field in cast(Sequence[ScalarField], arrays)]
+        dtype = numpy.result_type(*set(map(type, values)))
+        return numpy.fromiter(values, dtype=dtype, count=len(values))
+
     @classmethod
     def from_array(cls, array: Tensor) -> "ScalarField":  # type: ignore[override]
         return cls(array.item())
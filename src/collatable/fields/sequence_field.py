@@ -1,11 +1,96 @@
-from typing import Generic, TypeVar
+from typing import (
+    Generic,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
+)
 
-from collatable.fields.field import Field
+import numpy
+
+from collatable.fields.field import Field, PaddingValue
 from collatable.types import DataArrayT
 
 Self = TypeVar("Self", bound="SequenceField")
+T = TypeVar("T")
+TruncationStrategy = Literal["head", "tail", "middle"]
 
 
 class SequenceField(Generic[DataArrayT], Field[DataArrayT]):
+    __slots__ = ["_max_length", "_truncation"]
+    _SLOT_DEFAULTS = {"_max_length": None, "_truncation": "head"}
+
+    def __init__(
+        self,
+        padding_value: PaddingValue = 0,
+        *,
+        max_length: Optional[int] = None,
+        truncation: TruncationStrategy = "head",
+    ) -> None:
+        if max_length is not None and max_length < 1:
+            raise ValueError(f"max_length must be positive, but got {max_length}")
+        if truncation not in ("head", "tail", "middle"):
+            raise ValueError(f"Unknown truncation strategy: {truncation}")
+
+        super().__init__(padding_value=padding_value)
+
+        self._max_length = max_length
+        self._truncation: TruncationStrategy = truncation
+
     def __len__(self) -> int:
         raise NotImplementedError
+
+    @property
+    def max_length(self) -> Optional[int]:
+        return self._max_length
+
+    @property
+    def truncation(self) -> TruncationStrategy:
+        return self._truncation
+
+    def _get_length_budget(self) -> Optional[int]:
+        return self._max_length
+
+    def _get_kept_lengths(self, length: int) -> Tuple[int, int]:
+        max_length = self._get_length_budget()
+        if max_length is None or length <= max_length:
+            return length, 0
+        if self._truncation == "head":
+            return max_length, 0
+        if self._truncation == "tail":
+            return 0, max_length
+        head = (max_length + 1) // 2
+        return head, max_length - head
+
+    @overload
+    def truncate(self, values: numpy.ndarray) -> numpy.ndarray: ...
+
+    @overload
+    def truncate(self, values: Sequence[T]) -> Sequence[T]: ...
+
+    def truncate(
+        self, values: Union[Sequence[T], numpy.ndarray]
+    ) -> Union[Sequence[T], numpy.ndarray]:
+        head, tail = self._get_kept_lengths(len(values))
+        return self._truncate_to(values, head, tail)
+
+    @staticmethod
+    def _truncate_to(
+        values: Union[Sequence[T], numpy.ndarray], head: int, tail: int
+    ) -> Union[Sequence[T], numpy.ndarray]:
+        length = len(values)
+        if tail == 0:
+            return values if head == length else values[:head]
+        if head == 0:
+            return values[length - tail :]
+        if isinstance(values, numpy.ndarray):
+            return numpy.concatenate([values[:head], values[length - tail :]])
+        return [*values[:head], *values[length - tail :]]
+
+    def get_truncated_position(self, position: int) -> int:
+        length = len(self)
+        head, tail = self._get_kept_lengths(length)
+        return min(position, head) + max(0, position - (length - tail))
@@ -12,10 +12,12 @@ from typing import (
 )
 
 import numpy
+from numpy.typing import DTypeLike
 
 from collatable.fields.field import PaddingValue
 from collatable.fields.sequence_field import SequenceField
 from collatable.types import IntTensor
+from collatable.utils import cast_indices, is_training_indexer
 
 LabelT = TypeVar("LabelT", bound=Hashable)
 
@@ -27,7 +29,8 @@ class IDecotableIndexer(Protocol[LabelT]):
 
 
 class SequenceLabelField(Generic[LabelT], SequenceField[IntTensor]):
-    __slots__ = ["_labels", "_indexed_labels"]
+    __slots__ = ["_labels", "_indexed_labels", "_indexer", "_dtype", "_length_budget"]
+    _SLOT_DEFAULTS = {"_indexer": None, "_dtype": None, "_length_budget": None}
 
     def __init__(
         self,
@@ -37,6 +40,8 @@ class SequenceLabelField(Generic[LabelT], SequenceField[IntTensor]):
         vocab: Optional[Mapping[LabelT, int]] = None,
         indexer: Optional[Callable[[LabelT], int]] = None,
         padding_value: PaddingValue = 0,
+        lazy: bool = False,
+        dtype: Optional[DTypeLike] = None,
     ) -> None:
         if len(labels) != len(sequence_field):
             raise ValueError(
@@ -47,17 +52,31 @@ class SequenceLabelField(Generic[LabelT], SequenceField[IntTensor]):
         if vocab is not None:
             indexer = self._make_indexer(vocab)
 
-        super().__init__(padding_value=padding_value)
+        if lazy and is_training_indexer(indexer):
+            raise ValueError("Lazy indexing requires a frozen indexer.")
 
+        super().__init__(
+            padding_value=padding_value,
+            max_length=sequence_field.max_length,
+            truncation=sequence_field.truncation,
+        )
+
+        # labels align with the content tokens, so they follow the sequence
+        # field's budget, which excludes special tokens such as bos/eos
+        self._length_budget = sequence_field._get_length_budget()
         self._labels = labels
-        self._indexed_labels: Sequence[int]
+        self._indexed_labels: Optional[Sequence[int]] = None
+        self._indexer: Optional[Callable[[LabelT], int]] = None
+        self._dtype = None if dtype is None else numpy.dtype(dtype)
         if isinstance(self._labels[0], int):
             self._indexed_labels = cast(Sequence[int], self._labels)
         else:
             if indexer is None:
                 raise ValueError("Indexer must be specified if labels are strings.")
-            self._labels = self._labels
-            self._indexed_labels = [indexer(label) for label in self._labels]
+            if lazy:
+                self._indexer = indexer
+            else:
+                self._indexed_labels = [indexer(label) for label in self._labels]
 
     def __len__(self) -> int:
         return len(self._labels)
@@ -78,8 +97,19 @@ class SequenceLabelField(Generic[LabelT], SequenceField[IntTensor]):
     def labels(self) -> Sequence[LabelT]:
         return self._labels
 
+    def _get_length_budget(self) -> Optional[int]:
+        return self._length_budget
+
+    def _materialize(self) -> None:
+        if self._indexer is not None:
+            self._indexed_labels = [self._indexer(label) for label in self._labels]
+            self._indexer = None
+
     def as_array(self) -> IntTensor:
-        return numpy.array(self._indexed_labels)
+        self._materialize()
+        assert self._indexed_labels is not None
+        array = numpy.array(self.truncate(self._indexed_labels))
+        return array if self._dtype is None else cast_indices(array, self._dtype)
 
     @classmethod
     def from_array(  # type: ignore[override]
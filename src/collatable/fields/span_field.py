@@ -1,3 +1,5 @@
+from typing import Any, Tuple
+
 import numpy
 
 from collatable.fields.field import Field, PaddingValue
@@ -6,7 +8,7 @@ from collatable.types import IntTensor
 
 
 class SpanField(Field[IntTensor]):
-    __slots__ = ["_span_start", "_span_end", "_padding_value"]
+    __slots__ = ["_span_start", "_span_end", "_truncated_span", "_padding_value"]
 
     def __init__(
         self,
@@ -30,6 +32,12 @@ class SpanField(Field[IntTensor]):
 
         self._span_start = span_start
         self._span_end = span_end
+        self._truncated_span = self._truncate_span(span_start, span_end, sequence_field)
+
+    def __setstate__(self, state: Any) -> None:
+        super().__setstate__(state)
+        if not hasattr(self, "_truncated_span"):
+            self._truncated_span = (self._span_start, self._span_end)
 
     def __str__(self) -> str:
         return f"({self.span_start}, {self.span_end})"
@@ -45,8 +53,20 @@ class SpanField(Field[IntTensor]):
     def span_end(self) -> int:
         return self._span_end
 
+    @staticmethod
+    def _truncate_span(
+        span_start: int, span_end: int, sequence_field: SequenceField
+    ) -> Tuple[int, int]:
+        if sequence_field.max_length is None:
+            return span_start, span_end
+        start = sequence_field.get_truncated_position(span_start)
+        end = sequence_field.get_truncated_position(span_end)
+        if start == end and span_start != span_end:
+            return -1, -1
+        return start, end
+
     def as_array(self) -> IntTensor:
-        return numpy.array([self.span_start, self.span_end])
+        return numpy.array(self._truncated_span)
 
     @classmethod
     def from_array(  # type: ignore[override]
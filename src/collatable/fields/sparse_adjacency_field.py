@@ -0,0 +1,225 @@
+import itertools
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Mapping,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
+
+import numpy
+
+from collatable.fields.field import Field
+from collatable.fields.sequence_field import SequenceField
+from collatable.types import IntTensor
+from collatable.utils import is_training_indexer
+
+Self = TypeVar("Self", bound="SparseAdjacencyField")
+LabelT = TypeVar("LabelT", bound=Hashable)
+
+
+class IDecotableIndexer(Protocol[LabelT]):
+    def __call__(self, label: LabelT) -> int: ...
+
+    def decode(self, index: int) -> LabelT: ...
+
+
+class SparseAdjacencyField(Generic[LabelT], Field[Dict[str, IntTensor]]):
+    __slots__ = [
+        "_indices",
+        "_labels",
+        "_indexed_labels",
+        "_indexer",
+        "_num_nodes",
+    ]
+
+    def __init__(
+        self,
+        indices: Sequence[Tuple[int, int]],
+        sequence_field: SequenceField,
+        *,
+        labels: Optional[Sequence[LabelT]] = None,
+        vocab: Optional[Mapping[LabelT, int]] = None,
+        indexer: Optional[Callable[[LabelT], int]] = None,
+        lazy: bool = False,
+    ) -> None:
+        if labels is not None and len(indices) != len(labels):
+            raise ValueError("SparseAdjacencyField requires a label for every index.")
+        if vocab is not None and indexer is not None:
+            raise ValueError("Must specify either vocab or indexer.")
+        if vocab is not None:
+            indexer = self._make_indexer(vocab)
+        if (
+            labels
+            and not isinstance(labels[0], (int, numpy.integer))
+            and indexer is None
+        ):
+            raise ValueError("Vocab or indexer must be specified if label is not int.")
+        num_nodes = len(sequence_field)
+        edges = numpy.asarray(indices, dtype=numpy.int64).reshape(-1, 2)
+        if edges.size and (edges.min() < 0 or edges.max() >= num_nodes):
+            raise ValueError("Indices must be within the bounds of the sequence.")
+
+        if lazy and is_training_indexer(indexer):
+            raise ValueError("Lazy indexing requires a frozen indexer.")
+
+        super().__init__(padding_value=-1)
+
+        self._indices = indices
+        self._labels = labels
+        self._num_nodes = num_nodes
+        self._indexed_labels: Optional[Sequence[int]] = None
+        self._indexer: Optional[Callable[[LabelT], int]] = None
+        if labels:
+            if isinstance(labels[0], (int, numpy.integer)):
+                self._indexed_labels = cast(Sequence[int], labels)
+            elif lazy:
+                self._indexer = indexer
+            else:
+                assert indexer is not None
+                self._indexed_labels = [indexer(label) for label in labels]
+
+    def __str__(self) -> str:
+        return f"[{', '.join(str(index) for index in self._indices)}]"
+
+    def __repr__(self) -> str:
+        return f"SparseAdjacencyField(indices={self._indices}, num_nodes={self._num_nodes})"
+
+    @property
+    def num_nodes(self) -> int:
+        return self._num_nodes
+
+    @staticmethod
+    def _make_indexer(vocab: Mapping[LabelT, int]) -> Callable[[LabelT], int]:
+        def indexer(label: LabelT) -> int:
+            return vocab[label]
+
+        return indexer
+
+    def _materialize(self) -> None:
+        if self._indexer is not None:
+            assert self._labels is not None
+            self._indexed_labels = [self._indexer(label) for label in self._labels]
+            self._indexer = None
+
+    def _get_edge_labels(self) -> Sequence[int]:
+        self._materialize()
+        if self._indexed_labels is None:
+            return [1] * len(self._indices)
+        return self._indexed_labels
+
+    def as_array(self) -> Dict[str, IntTensor]:
+        return {
+            "edge_index": numpy.asarray(self._indices, dtype=numpy.int64)
+            .reshape(-1, 2)
+            .T.copy(),
+            "edge_labels": numpy.asarray(self._get_edge_labels(), dtype=numpy.int_),
+            "num_nodes": numpy.asarray(self._num_nodes, dtype=numpy.int64),
+        }
+
+    def collate(  # type: ignore[override]
+        self,
+        arrays: Union[
+            Sequence[Mapping[str, IntTensor]], Sequence["SparseAdjacencyField[LabelT]"]
+        ],
+    ) -> Dict[str, IntTensor]:
+        if isinstance(arrays[0], SparseAdjacencyField):
+            fields = cast(Sequence[SparseAdjacencyField[LabelT]], arrays)
+            num_edges = numpy.fromiter(
+                (len(field._indices) for field in fields), dtype=numpy.int64
+            )
+            num_nodes = numpy.fromiter(
+                (field._num_nodes for field in fields), dtype=numpy.int64
+            )
+            edge_index = numpy.fromiter(
+                itertools.chain.from_iterable(
+                    itertools.chain.from_iterable(field._indices) for field in fields
+                ),
+                dtype=numpy.int64,
+            ).reshape(-1, 2)
+            edge_labels = numpy.fromiter(
+                itertools.chain.from_iterable(
+                    field._get_edge_labels() for field in fields
+                ),
+                dtype=numpy.int_,
+            )
+        else:
+            instances = cast(Sequence[Mapping[str, IntTensor]], arrays)
+            num_edges = numpy.fromiter(
+                (instance["edge_index"].shape[1] for instance in instances),
+                dtype=numpy.int64,
+            )
+            num_nodes = numpy.fromiter(
+                (instance["num_nodes"] for instance in instances), dtype=numpy.int64
+            )
+            edge_index = numpy.concatenate(
+                [instance["edge_index"] for instance in instances], axis=1
+            ).T
+            edge_labels = numpy.concatenate(
+                [instance["edge_labels"] for instance in instances]
+            )
+
+        ptr = numpy.zeros(len(num_nodes) + 1, dtype=numpy.int64)
+        numpy.cumsum(num_nodes, out=ptr[1:])
+        edge_index = edge_index + numpy.repeat(ptr[:-1], num_edges)[:, None]
+        return {
+            "edge_index": edge_index.T.copy(),
+            "edge_labels": edge_labels,
+            "batch": numpy.repeat(numpy.arange(len(num_nodes)), num_nodes),
+            "ptr": ptr,
+        }
+
+    @staticmethod
+    def unbatch(array: Mapping[str, IntTensor]) -> List[Dict[str, IntTensor]]:
+        ptr = array["ptr"]
+        num_graphs = len(ptr) - 1
+        edge_index = array["edge_index"]
+        graph_ids = array["batch"][edge_index[0]]
+        order = numpy.argsort(graph_ids, kind="stable")
+        sections = numpy.cumsum(numpy.bincount(graph_ids, minlength=num_graphs))[:-1]
+        edge_indices = numpy.split(
+            edge_index[:, order] - ptr[graph_ids[order]], sections, axis=1
+        )
+        edge_labels = numpy.split(array["edge_labels"][order], sections)
+        num_nodes = numpy.diff(ptr)
+        return [
+            {
+                "edge_index": edge_indices[i],
+                "edge_labels": edge_labels[i],
+                "num_nodes": num_nodes[i],
+            }
+            for i in range(num_graphs)
+        ]
+
+    @classmethod
+    def from_array(  # type: ignore[override]
+        cls,
+        array: Mapping[str, IntTensor],
+        *,
+        sequence_field: SequenceField,
+        indexer: Optional[IDecotableIndexer[LabelT]] = None,
+    ) -> "SparseAdjacencyField[LabelT]":
+        edge_index = array["edge_index"]
+        if edge_index.ndim != 2 or edge_index.shape[0] != 2:
+            raise ValueError(
+                f"SparseAdjacencyField expects an edge index of shape (2, E), but got shape {edge_index.shape}"
+            )
+        if int(array["num_nodes"]) != len(sequence_field):
+            raise ValueError("Number of nodes does not match the sequence field.")
+        indices = cast(List[Tuple[int, int]], list(map(tuple, edge_index.T.tolist())))
+        labels: List = array["edge_labels"].tolist()
+        if indexer is not None:
+            get_values_by_indices = getattr(indexer, "get_values_by_indices", None)
+            if get_values_by_indices is not None:
+                labels = get_values_by_indices(array["edge_labels"]).tolist()
+            else:
+                labels = [indexer.decode(label) for label in labels]
+        return cls(indices, sequence_field, labels=labels, indexer=indexer)
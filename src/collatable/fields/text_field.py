@@ -1,5 +1,7 @@
 from typing import (
+    Any,
     Callable,
+    Dict,
     Generic,
     Hashable,
     Iterator,
@@ -7,13 +9,18 @@ from typing import (
     Optional,
     Protocol,
     Sequence,
+    Tuple,
     TypeVar,
+    Union,
+    cast,
 )
 
 import numpy
+from numpy.typing import DTypeLike
 
 from collatable.fields.field import PaddingValue
-from collatable.fields.sequence_field import SequenceField
+from collatable.fields.sequence_field import SequenceField, TruncationStrategy
+from collatable.utils import cast_indices, is_training_indexer, stack_with_padding
 
 Self = TypeVar("Self", bound="TextField")
 TokenT = TypeVar("TokenT", bound=Hashable)
@@ -26,7 +33,23 @@ class IDecotableIndexer(Protocol[TokenT]):
 
 
 class TextField(Generic[TokenT], SequenceField[Mapping[str, numpy.ndarray]]):
-    __slots__ = ["_tokens", "_padding_value", "_indexed_tokens"]
+    __slots__ = [
+        "_tokens",
+        "_padding_value",
+        "_indexer",
+        "_indexed_tokens",
+        "_dtype",
+        "_store_mask",
+        "_decoder",
+        "_num_special_tokens",
+    ]
+    _SLOT_DEFAULTS = {
+        "_indexer": None,
+        "_dtype": None,
+        "_store_mask": True,
+        "_decoder": None,
+        "_num_special_tokens": (0, 0),
+    }
 
     def __init__(
         self,
@@ -37,21 +60,50 @@ class TextField(Generic[TokenT], SequenceField[Mapping[str, numpy.ndarray]]):
             Callable[[Sequence[TokenT]], Mapping[str, numpy.ndarray]]
         ] = None,
         padding_value: PaddingValue = 0,
+        lazy: bool = False,
+        dtype: Optional[DTypeLike] = None,
+        store_mask: bool = True,
+        max_length: Optional[int] = None,
+        truncation: TruncationStrategy = "head",
+        num_special_tokens: Optional[Tuple[int, int]] = None,
     ) -> None:
         if (vocab is None is indexer) or (vocab is not None and indexer is not None):
             raise ValueError("Must specify either vocab or indexer.")
+        num_special_tokens = self._get_num_special_tokens(
+            indexer, num_special_tokens, max_length
+        )
         if vocab is not None:
-            indexer = self._make_indexer(vocab)
+            indexer = self._make_indexer(vocab, numpy.int64 if dtype is None else dtype)
 
         assert indexer is not None
 
-        super().__init__(padding_value=padding_value)
+        if lazy and is_training_indexer(indexer):
+            raise ValueError("Lazy indexing requires a frozen indexer.")
 
-        self._tokens = tokens
-        self._indexed_tokens = indexer(self.tokens)
+        super().__init__(
+            padding_value=padding_value, max_length=max_length, truncation=truncation
+        )
+
+        self._tokens: Optional[Sequence[TokenT]] = tokens
+        self._decoder: Optional[IDecotableIndexer[TokenT]] = None
+        self._indexer: Optional[
+            Callable[[Sequence[TokenT]], Mapping[str, numpy.ndarray]]
+        ] = None
+        self._indexed_tokens: Optional[Mapping[str, numpy.ndarray]] = None
+        self._dtype = None if dtype is None else numpy.dtype(dtype)
+        self._store_mask = store_mask
+        self._num_special_tokens = num_special_tokens
+        if lazy:
+            self._indexer = indexer
+        else:
+            self._indexed_tokens = self._normalize(indexer(tokens))
 
     def __len__(self) -> int:
-        return len(self.tokens)
+        if self._tokens is None:
+            assert self._indexed_tokens is not None
+            num_ids = len(self._indexed_tokens["token_ids"])
+            return num_ids - sum(self._num_special_tokens)
+        return len(self._tokens)
 
     def __iter__(self) -> Iterator[TokenT]:
         return iter(self.tokens)
@@ -67,11 +119,104 @@ class TextField(Generic[TokenT], SequenceField[Mapping[str, numpy.ndarray]]):
 
     @property
     def tokens(self) -> Sequence[TokenT]:
+        if self._tokens is None:
+            if self._decoder is not None:
+                tokens = self._decoder.decode(self._get_indexed_tokens())
+            else:
+                assert self._indexed_tokens is not None
+                tokens = self._indexed_tokens["token_ids"].tolist()
+            leading, trailing = self._num_special_tokens
+            return cast(Sequence[TokenT], tokens[leading : len(tokens) - trailing])
         return self._tokens
 
-    def as_array(self) -> Mapping[str, numpy.ndarray]:
+    def _materialize(self) -> None:
+        if self._indexer is not None:
+            self._indexed_tokens = self._normalize(self._indexer(self.tokens))
+            self._indexer = None
+
+    def _normalize(
+        self, indexed_tokens: Mapping[str, numpy.ndarray]
+    ) -> Mapping[str, numpy.ndarray]:
+        if not self._store_mask and "mask" in indexed_tokens:
+            indexed_tokens = {
+                key: value for key, value in indexed_tokens.items() if key != "mask"
+            }
+        if self._dtype is None or indexed_tokens["token_ids"].dtype == self._dtype:
+            return indexed_tokens
+        return {
+            **indexed_tokens,
+            "token_ids": cast_indices(indexed_tokens["token_ids"], self._dtype),
+        }
+
+    def _get_indexed_tokens(self) -> Mapping[str, numpy.ndarray]:
+        self._materialize()
+        assert self._indexed_tokens is not None
+        if "mask" not in self._indexed_tokens:
+            mask = numpy.ones(len(self._indexed_tokens["token_ids"]), dtype=bool)
+            return {**self._indexed_tokens, "mask": mask}
         return self._indexed_tokens
 
+    def _get_length_budget(self) -> Optional[int]:
+        if self._max_length is None:
+            return None
+        return self._max_length - sum(self._num_special_tokens)
+
+    def _truncate_indexed_tokens(
+        self, indexed_tokens: Mapping[str, numpy.ndarray]
+    ) -> Mapping[str, numpy.ndarray]:
+        if self._max_length is None:
+            return indexed_tokens
+        leading, trailing = self._num_special_tokens
+        length = len(indexed_tokens["token_ids"]) - leading - trailing
+        head, tail = self._get_kept_lengths(length)
+        if head + tail == length:
+            return indexed_tokens
+        return {
+            key: cast(
+                numpy.ndarray, self._truncate_to(value, leading + head, tail + trailing)
+            )
+            for key, value in indexed_tokens.items()
+        }
+
+    def as_array(self) -> Mapping[str, numpy.ndarray]:
+        return self._truncate_indexed_tokens(self._get_indexed_tokens())
+
+    @classmethod
+    def _has_padded_collate(cls) -> bool:
+        return True
+
+    def collate(  # type: ignore[override]
+        self,
+        arrays: Union[
+            Sequence[Mapping[str, numpy.ndarray]], Sequence["TextField[TokenT]"]
+        ],
+    ) -> Mapping[str, numpy.ndarray]:
+        if not isinstance(arrays[0], TextField) or any(
+            cast(TextField, field)._store_mask for field in arrays
+        ):
+            return super().collate(arrays)  # type: ignore[arg-type]
+        fields = cast(Sequence[TextField[TokenT]], arrays)
+        indexed_tokens = []
+        for field in fields:
+            field._materialize()
+            assert field._indexed_tokens is not None
+            indexed_tokens.append(field._truncate_indexed_tokens(field._indexed_tokens))
+        output: Dict[str, numpy.ndarray] = {
+            key: stack_with_padding(
+                [x[key] for x in indexed_tokens],
+                padding_value=self.padding_value.get(key, 0),
+            )
+            for key in indexed_tokens[0]
+        }
+        lengths = numpy.fromiter(
+            (len(x["token_ids"]) for x in indexed_tokens),
+            dtype=numpy.int64,
+            count=len(indexed_tokens),
+        )
+        max_length = output["token_ids"].shape[1] if len(lengths) > 0 else 0
+        output["mask"] = numpy.arange(max_length) < lengths[:, None]
+        return output
+
     @classmethod
     def from_array(  # type: ignore[override]
         cls,
@@ -83,13 +228,71 @@ class TextField(Generic[TokenT], SequenceField[Mapping[str, numpy.ndarray]]):
         tokens = indexer.decode(array)
         return cls(tokens, indexer=indexer, padding_value=padding_value)
 
+    @classmethod
+    def from_ids(
+        cls,
+        token_ids: numpy.ndarray,
+        *,
+        mask: Optional[numpy.ndarray] = None,
+        tokens: Optional[Sequence[TokenT]] = None,
+        indexer: Optional[IDecotableIndexer[TokenT]] = None,
+        padding_value: PaddingValue = 0,
+        max_length: Optional[int] = None,
+        truncation: TruncationStrategy = "head",
+        num_special_tokens: Optional[Tuple[int, int]] = None,
+    ) -> "TextField[TokenT]":
+        if token_ids.ndim != 1:
+            raise ValueError(
+                f"TextField expects 1-dimensional token ids, but got shape {token_ids.shape}"
+            )
+        if mask is not None and mask.shape != token_ids.shape:
+            raise ValueError("Mask must have the same shape as token ids.")
+        field = cls.__new__(cls)
+        SequenceField.__init__(
+            field,
+            padding_value=padding_value,
+            max_length=max_length,
+            truncation=truncation,
+        )
+        field._tokens = tokens
+        field._decoder = indexer
+        field._indexer = None
+        field._indexed_tokens = (
+            {"token_ids": token_ids}
+            if mask is None
+            else {"token_ids": token_ids, "mask": mask}
+        )
+        field._dtype = None
+        field._store_mask = mask is not None
+        field._num_special_tokens = cls._get_num_special_tokens(
+            indexer, num_special_tokens, max_length
+        )
+        return field
+
+    @staticmethod
+    def _get_num_special_tokens(
+        indexer: Any,
+        num_special_tokens: Optional[Tuple[int, int]],
+        max_length: Optional[int],
+    ) -> Tuple[int, int]:
+        if num_special_tokens is None:
+            num_special_tokens = getattr(indexer, "num_special_tokens", (0, 0))
+        assert num_special_tokens is not None
+        if max_length is not None and sum(num_special_tokens) >= max_length:
+            raise ValueError(
+                f"max_length={max_length} leaves no room besides special tokens."
+            )
+        return num_special_tokens
+
     @staticmethod
     def _make_indexer(
         vocab: Mapping[TokenT, int],
+        dtype: DTypeLike = numpy.int64,
     ) -> Callable[[Sequence[TokenT]], Mapping[str, numpy.ndarray]]:
         def indexer(tokens: Sequence[TokenT]) -> Mapping[str, numpy.ndarray]:
-            token_ids: numpy.ndarray = numpy.array(
-                [vocab[token] for token in tokens], dtype=numpy.int64
+            token_ids: numpy.ndarray = cast_indices(
+                numpy.array([vocab[token] for token in tokens], dtype=numpy.int64),
+                dtype,
             )
             mask: numpy.ndarray = numpy.ones_like(token_ids, dtype=bool)
             output = {"token_ids": token_ids, "mask": mask}
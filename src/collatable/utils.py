@@ -1,6 +1,7 @@
-from typing import List, Mapping, Sequence, Type, cast
+from typing import Any, List, Mapping, Sequence, Type, cast
 
 import numpy
+from numpy.typing import DTypeLike
 
 from collatable.types import ArrayLike, DataArray, ScalarT, TensorT
 
@@ -26,6 +27,30 @@ def stack_with_padding(
     return stacked
 
 
+def get_index_dtype(size: int) -> numpy.dtype:
+    for dtype in (numpy.int8, numpy.int16, numpy.int32):
+        if size <= numpy.iinfo(dtype).max + 1:
+            return numpy.dtype(dtype)
+    return numpy.dtype(numpy.int64)
+
+
+def cast_indices(array: TensorT, dtype: DTypeLike) -> TensorT:
+    dtype = numpy.dtype(dtype)
+    if array.dtype == dtype:
+        return array
+    if array.size > 0 and numpy.issubdtype(dtype, numpy.integer):
+        info = numpy.iinfo(dtype)
+        low, high = int(array.min()), int(array.max())
+        if low < info.min or high > info.max:
+            raise ValueError(f"Indices in [{low}, {high}] do not fit in {dtype}.")
+    return cast(TensorT, array.astype(dtype))
+
+
+def is_training_indexer(indexer: Any) -> bool:
+    owner = getattr(indexer, "__self__", indexer)
+    return bool(getattr(owner, "training", False))
+
+
 def get_scalar_default_value(cls: Type[ScalarT]) -> ScalarT:
     if issubclass(cls, bool):
         return cast(ScalarT, False)
@@ -0,0 +1,35 @@
+from typing import Callable, Dict, Optional, Sequence
+
+import pytest
+
+from collatable.extras import LabelIndexer, TokenIndexer
+from collatable.extras.datamodule import (
+    DataModule,
+    LabelFieldTransform,
+    TextFieldTransform,
+)
+
+
+@pytest.fixture
+def build_text_label_datamodule() -> Callable[..., DataModule[Dict[str, str]]]:
+    def build(
+        dataset: Sequence[Dict[str, str]],
+        *,
+        token_indexer: Optional[TokenIndexer[str]] = None,
+        label_indexer: Optional[LabelIndexer[str]] = None,
+    ) -> DataModule[Dict[str, str]]:
+        if token_indexer is None:
+            token_indexer = TokenIndexer(default="<unk>", specials=["<pad>", "<unk>"])
+        if label_indexer is None:
+            label_indexer = LabelIndexer[str]()
+        datamodule = DataModule[Dict[str, str]](
+            fields={
+                "text": TextFieldTransform(indexer=token_indexer, pad_token="<pad>"),
+                "label": LabelFieldTransform(indexer=label_indexer),
+            }
+        )
+        with token_indexer.context(train=True), label_indexer.context(train=True):
+            datamodule.build(dataset)
+        return datamodule
+
+    return build
@@ -0,0 +1,98 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Dict, Iterator, List, cast
+
+import numpy
+
+from collatable import collate
+from collatable.extras import (
+    AsyncBatchIterator,
+    AsyncDataModule,
+    DataModule,
+    TextFieldTransform,
+    TokenIndexer,
+)
+from collatable.fields import Field, ScalarField, TextField
+from collatable.types import DataArray
+
+
+def test_async_datamodule_and_batch_iterator(
+    build_text_label_datamodule: Callable[..., DataModule[Dict[str, str]]],
+) -> None:
+    dataset = [
+        {"text": f"this is document {i} .", "label": "even" if i % 2 else "odd"}
+        for i in range(20)
+    ]
+    datamodule = build_text_label_datamodule(dataset)
+
+    async def read_dataset() -> AsyncIterator[Dict[str, str]]:
+        for example in dataset:
+            await asyncio.sleep(0)
+            yield example
+
+    async def run() -> List[Dict[str, DataArray]]:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            instances = AsyncDataModule(
+                datamodule, executor=executor, chunk_size=3, max_pending=2
+            )(read_dataset())
+            batches = AsyncBatchIterator(
+                instances, batch_size=8, drop_last=True, executor=executor
+            )
+            return [batch async for batch in batches]
+
+    batches = asyncio.run(run())
+    expected = collate(list(datamodule(dataset[:16])))
+
+    assert len(batches) == 2
+    for i, batch in enumerate(batches):
+        assert isinstance(expected["label"], numpy.ndarray)
+        numpy.testing.assert_array_equal(
+            batch["label"], expected["label"][i * 8 : (i + 1) * 8]
+        )
+        assert isinstance(batch["text"], dict)
+        assert batch["text"]["token_ids"].shape == (8, 5)
+
+
+def test_async_batch_iterator_pulls_sync_sources_off_the_loop() -> None:
+    threads = set()
+
+    def generate() -> Iterator[Dict[str, Field]]:
+        for value in range(5):
+            threads.add(threading.get_ident())
+            yield {"value": ScalarField(value)}
+
+    async def run() -> List[Dict[str, DataArray]]:
+        return [batch async for batch in AsyncBatchIterator(generate(), 2)]
+
+    batches = asyncio.run(run())
+    assert threads and threading.get_ident() not in threads
+    values = [batch["value"] for batch in batches]
+    assert all(isinstance(value, numpy.ndarray) for value in values)
+    assert [numpy.asarray(value).tolist() for value in values] == [[0, 1], [2, 3], [4]]
+
+
+def test_async_datamodule_shares_text_cache_across_threads() -> None:
+    token_indexer = TokenIndexer[str]()
+    transform = TextFieldTransform(indexer=token_indexer, cache_size=4)
+    texts = [f"document {i % 6} ." for i in range(60)]
+    with token_indexer.context(train=True):
+        transform.build(texts)
+    datamodule = DataModule[Dict[str, str]](fields={"text": transform})
+
+    async def run() -> List[Dict[str, Field]]:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            instances = AsyncDataModule(
+                datamodule, executor=executor, chunk_size=1, max_pending=8
+            )([{"text": text} for text in texts])
+            return [instance async for instance in instances]
+
+    instances = asyncio.run(run())
+    info = transform.cache_info()
+    assert info.hits + info.misses == len(texts)
+    assert info.currsize <= 4
+    fields = [instance["text"] for instance in instances]
+    assert all(isinstance(field, TextField) for field in fields)
+    assert [cast(TextField, field).tokens for field in fields] == [
+        text.split() for text in texts
+    ]
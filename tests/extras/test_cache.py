@@ -0,0 +1,39 @@
+from pathlib import Path
+from typing import Callable, Dict
+
+from collatable.extras import DataModuleCache, LabelIndexer
+from collatable.extras.datamodule import DataModule
+from collatable.fields import TextField
+
+
+def test_datamodule_cache(
+    tmp_path: Path,
+    build_text_label_datamodule: Callable[..., DataModule[Dict[str, str]]],
+) -> None:
+    source = tmp_path / "data.txt"
+    source.write_text("how are you?\twhat is your name?\n")
+    dataset = [
+        {"text": "how are you?", "label": "question"},
+        {"text": "I am fine.", "label": "answer"},
+    ]
+    label_indexer = LabelIndexer[str]()
+    datamodule = build_text_label_datamodule(dataset, label_indexer=label_indexer)
+
+    cache = DataModuleCache(tmp_path / "cache")
+    instances = cache(datamodule, dataset, source=source)
+    assert len(instances) == 2
+    assert isinstance(instances[1]["text"], TextField)
+    assert instances[1]["text"].tokens == ["I", "am", "fine", "."]
+
+    # cached instances are reused without running the transforms again
+    cached_instances = cache(datamodule, [], source=source)
+    assert cached_instances.path == instances.path
+    assert len(cached_instances) == 2
+
+    # any change of the configuration or the source invalidates the cache
+    with label_indexer.context(train=True):
+        label_indexer("greeting")
+    assert cache.get_path(datamodule, source) != instances.path
+
+    source.write_text("how are you?\n")
+    assert cache.get_path(datamodule, source) != instances.path
@@ -1,7 +1,11 @@
-from typing import Iterator
+from typing import Dict, Iterator, Mapping, cast
 
-from collatable import LabelField, MetadataField, TextField
-from collatable.extras.dataloader import DataLoader, DefaultBatchSampler
+from collatable import Field, LabelField, MetadataField, TextField
+from collatable.extras.dataloader import (
+    DataLoader,
+    DefaultBatchSampler,
+    StreamingBatchSampler,
+)
 from collatable.extras.dataset import Dataset
 from collatable.extras.indexer import LabelIndexer, TokenIndexer
 
@@ -56,3 +60,31 @@ def test_dataloader() -> None:
     dataloader = DataLoader(DefaultBatchSampler(batch_size=2, shuffle=True))
     batch_iterator = dataloader(dataset)
     assert all(len(batch["label"]) == 2 for batch in batch_iterator)
+
+
+def test_dataloader_with_streaming_batch_sampler() -> None:
+    token_indexer = TokenIndexer[str](specials=["<PAD>"])
+    with token_indexer.context(train=True):
+        token_indexer(["a"])
+
+    def read_dataset() -> Iterator[Dict[str, Field]]:
+        for i in range(25):
+            yield {"tokens": TextField(["a"] * (i % 7 + 1), indexer=token_indexer)}
+
+    def get_length(instance: Mapping[str, Field]) -> int:
+        return len(cast(TextField, instance["tokens"]))
+
+    dataloader = DataLoader(
+        StreamingBatchSampler(
+            batch_size=4, buffer_size=10, shuffle=True, sort_key=get_length
+        )
+    )
+    batch_sizes = []
+    for batch in dataloader(read_dataset()):
+        tokens = batch["tokens"]
+        assert isinstance(tokens, dict)
+        batch_sizes.append(len(tokens["token_ids"]))
+    assert sorted(batch_sizes) == [1, 4, 4, 4, 4, 4, 4]
+
+    dataloader = DataLoader(StreamingBatchSampler(batch_size=4, drop_last=True))
+    assert len(list(dataloader(read_dataset()))) == 6
@@ -1,6 +1,21 @@
+import pickle
 from dataclasses import dataclass
-from typing import Mapping, Sequence, Union
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import numpy
+import pytest
 
+from collatable import collate
 from collatable.extras import (
     DataLoader,
     Dataset,
@@ -10,6 +25,8 @@ from collatable.extras import (
 )
 from collatable.extras.datamodule import (
     DataModule,
+    FieldAccessor,
+    FieldTransform,
     LabelFieldTransform,
     TextFieldTransform,
 )
@@ -82,3 +99,211 @@ def test_datamodule() -> None:
         ["It", "is", "10", ":", "00", "AM", "."],
         ["Je", "vais", "bien", "."],
     ]
+
+
+def test_datamodule_build_makes_single_pass() -> None:
+    dataset = [
+        {"source": "how are you?", "target": "I am fine.", "language": "en"},
+        {"source": "comment ça va?", "target": "Je vais bien.", "language": "fr"},
+    ]
+
+    def build_indexers(incremental: bool) -> Tuple[TokenIndexer, LabelIndexer]:
+        token_indexer = TokenIndexer(default="<unk>", specials=["<pad>", "<unk>"])
+        language_indexer = LabelIndexer[str]()
+        datamodule = DataModule[Dict[str, str]](
+            fields={
+                "source": TextFieldTransform(indexer=token_indexer, pad_token="<pad>"),
+                "target": TextFieldTransform(indexer=token_indexer, pad_token="<pad>"),
+                "language": LabelFieldTransform(indexer=language_indexer),
+            }
+        )
+        with token_indexer.context(train=True), language_indexer.context(train=True):
+            if incremental:
+                datamodule.build(iter(dataset))
+            else:
+                for name, field in datamodule.fields.items():
+                    field.transform.build(obj[name] for obj in dataset)
+        return token_indexer, language_indexer
+
+    token_indexer, language_indexer = build_indexers(incremental=True)
+    expected_token_indexer, expected_language_indexer = build_indexers(
+        incremental=False
+    )
+    assert len(token_indexer) == 16
+    assert token_indexer["Je"] == expected_token_indexer["Je"]
+    assert token_indexer._index_to_value == expected_token_indexer._index_to_value
+    assert language_indexer._index_to_value == expected_language_indexer._index_to_value
+
+
+def test_datamodule_build_feeds_custom_indexers_every_text() -> None:
+    class RecordingIndexer(TokenIndexer[str]):
+        def __init__(self) -> None:
+            super().__init__()
+            self.calls: List[Sequence[str]] = []
+
+        def encode(self, tokens: Sequence[str]) -> Mapping[str, numpy.ndarray]:
+            self.calls.append(list(tokens))
+            return super().encode(tokens)
+
+    dataset = [{"text": "a b"}, {"text": "b a"}, {"text": "a b"}]
+    indexer = RecordingIndexer()
+    datamodule = DataModule[Dict[str, str]](
+        fields={"text": TextFieldTransform(indexer=indexer)}
+    )
+    with indexer.context(train=True):
+        datamodule.build(iter(dataset))
+    assert indexer.calls == [["a", "b"], ["b", "a"], ["a", "b"]]
+
+
+def test_datamodule_build_rejects_one_shot_iterators_for_full_builds() -> None:
+    class VocabTransform(FieldTransform[str]):
+        def __init__(self) -> None:
+            self.vocab: Dict[str, int] = {}
+
+        def build(self, dataset: Iterable[str]) -> None:
+            for value in sorted(set(dataset)):
+                self.vocab[value] = len(self.vocab)
+
+    dataset = [{"source": "b", "target": "x"}, {"source": "a", "target": "y"}]
+    source, target = VocabTransform(), VocabTransform()
+    datamodule = DataModule[Dict[str, str]](fields={"source": source, "target": target})
+    with pytest.raises(ValueError):
+        datamodule.build(iter(dataset))
+    datamodule.build(dataset)
+    assert source.vocab == {"a": 0, "b": 1}
+    assert target.vocab == {"x": 0, "y": 1}
+
+
+def test_datamodule_can_process_instances_in_parallel(
+    build_text_label_datamodule: Callable[..., DataModule[Dict[str, str]]],
+) -> None:
+    dataset = [
+        {"text": f"this is document {i} .", "label": "even" if i % 2 else "odd"}
+        for i in range(100)
+    ]
+    label_indexer = LabelIndexer[str]()
+    datamodule = build_text_label_datamodule(dataset, label_indexer=label_indexer)
+
+    with label_indexer.context(train=True):
+        with pytest.raises(ValueError):
+            datamodule(dataset, num_workers=2)
+
+    expected = collate(list(datamodule(dataset)))
+    output = collate(list(datamodule(dataset, num_workers=2, chunk_size=7)))
+
+    assert output.keys() == expected.keys()
+    numpy.testing.assert_array_equal(output["label"], expected["label"])
+    assert isinstance(output["text"], dict)
+    assert isinstance(expected["text"], dict)
+    for key in ("token_ids", "mask"):
+        numpy.testing.assert_array_equal(output["text"][key], expected["text"][key])
+
+
+def test_text_field_transform_can_cache_encoded_texts() -> None:
+    token_indexer = TokenIndexer(default="<unk>", specials=["<pad>", "<unk>"])
+    transform = TextFieldTransform(
+        indexer=token_indexer, pad_token="<pad>", cache_size=2
+    )
+    with token_indexer.context(train=True):
+        transform.build(["how are you?", "I am fine."])
+        transform("how are you?")
+    assert transform.cache_info().currsize == 0
+
+    texts = ["how are you?", "I am fine.", "how are you?", "who are you?"]
+    fields = [transform(text) for text in texts]
+    assert transform.cache_info() == (1, 3, 2, 2)
+    assert fields[0].as_array() is fields[2].as_array()
+    assert fields[3].tokens == ["who", "are", "you", "?"]
+    assert fields[3].as_array()["token_ids"].tolist() == [1, 3, 4, 5]
+
+    transform.cache_clear()
+    assert transform.cache_info() == (0, 0, 2, 0)
+
+    token_ids = fields[0].as_array()["token_ids"]
+    with pytest.raises(ValueError):
+        token_ids[0] = 0
+
+
+def test_field_accessor() -> None:
+    @dataclass
+    class Document:
+        meta: Dict[str, str]
+
+    @dataclass
+    class Example:
+        document: Document
+
+    accessor = FieldAccessor("document.meta.title")
+    objs = [
+        Example(Document({"title": "foo"})),
+        {"document": {"meta": {"title": "bar"}}},
+        {"document": Document({"title": "baz"})},
+    ]
+    assert [accessor(obj) for obj in objs] == ["foo", "bar", "baz"]
+    assert accessor.batch(objs) == ["foo", "bar", "baz"]
+    assert accessor.batch(objs[:1] * 3) == ["foo", "foo", "foo"]
+    assert pickle.loads(pickle.dumps(accessor))(objs[1]) == "bar"
+
+
+@pytest.mark.parametrize("dtype", [None, "auto"])
+def test_datamodule_can_collate_batch(
+    dtype: Optional[str],
+    build_text_label_datamodule: Callable[..., DataModule[Dict[str, str]]],
+) -> None:
+    dataset = [
+        {"text": "how are you?", "label": "question"},
+        {"text": "I am fine.", "label": "answer"},
+        {"text": "", "label": "answer"},
+        {"text": "what is that?", "label": "question"},
+    ]
+    token_indexer = TokenIndexer(
+        default="<unk>",
+        specials=["<pad>", "<unk>", "<s>", "</s>"],
+        bos="<s>",
+        eos="</s>",
+        dtype=dtype,
+    )
+    datamodule = build_text_label_datamodule(
+        dataset[:2],
+        token_indexer=token_indexer,
+        label_indexer=LabelIndexer[str](dtype=dtype),
+    )
+
+    expected = collate(list(datamodule(dataset)))
+    output = datamodule.collate_batch(dataset)
+
+    assert output.keys() == expected.keys()
+    assert isinstance(output["label"], numpy.ndarray)
+    assert isinstance(expected["label"], numpy.ndarray)
+    assert output["label"].dtype == expected["label"].dtype
+    numpy.testing.assert_array_equal(output["label"], expected["label"])
+    assert isinstance(output["text"], dict)
+    assert isinstance(expected["text"], dict)
+    assert output["text"].keys() == expected["text"].keys()
+    for key in ("token_ids", "mask"):
+        assert output["text"][key].dtype == expected["text"][key].dtype
+        numpy.testing.assert_array_equal(output["text"][key], expected["text"][key])
+
+
+def test_datamodule_can_reconstruct_batch(
+    build_text_label_datamodule: Callable[..., DataModule[Dict[str, str]]],
+) -> None:
+    dataset = [
+        {"text": "how are you?", "label": "question"},
+        {"text": "I am fine.", "label": "answer"},
+        {"text": "what is that?", "label": "question"},
+    ]
+    datamodule = build_text_label_datamodule(dataset[:2])
+
+    batch = datamodule.collate_batch(dataset)
+    output = datamodule.reconstruct_batch(batch)
+    assert output == [
+        datamodule.reconstruct(item)
+        for item in debatched(batch)
+        if isinstance(item, Mapping)
+    ]
+    assert output == [
+        {"text": ["how", "are", "you", "?"], "label": "question"},
+        {"text": ["I", "am", "fine", "."], "label": "answer"},
+        {"text": ["<unk>", "<unk>", "<unk>", "?"], "label": "question"},
+    ]
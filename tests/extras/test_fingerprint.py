@@ -0,0 +1,22 @@
+import threading
+from typing import Any, Callable, Mapping
+
+import pytest
+
+from collatable.extras.fingerprint import fingerprint
+
+
+def _make_accessor(key: str) -> Callable[[Mapping[str, Any]], Any]:
+    return lambda obj: obj[key]
+
+
+def test_fingerprint_distinguishes_function_configurations() -> None:
+    assert fingerprint(lambda obj: obj["title"]) != fingerprint(lambda obj: obj["body"])
+    assert fingerprint(_make_accessor("title")) != fingerprint(_make_accessor("body"))
+    assert fingerprint(_make_accessor("title")) == fingerprint(_make_accessor("title"))
+    assert fingerprint(str.split) != fingerprint(str.lower)
+
+
+def test_fingerprint_rejects_unidentifiable_objects() -> None:
+    with pytest.raises(ValueError):
+        fingerprint(threading.Lock())
@@ -1,6 +1,7 @@
+import numpy
 import pytest
 
-from collatable.extras.indexer import TokenIndexer
+from collatable.extras.indexer import LabelIndexer, TokenIndexer
 
 
 def test_token_indexer() -> None:
@@ -20,3 +21,61 @@ def test_token_indexer() -> None:
     assert isinstance(array, dict)
     assert array["token_ids"].tolist() == [0, 1, 2, 3, 4]
     assert array["mask"].sum() == 5
+
+    batch = indexer.encode_batch([list("ab"), list("cde")])
+    assert indexer.decode_batch(batch) == [["a", "b"], ["c", "d", "e"]]
+    assert indexer.decode_batch(indexer.encode_batch([])) == []
+
+
+def test_label_indexer_can_encode_batch() -> None:
+    indexer = LabelIndexer[str]()
+    with indexer.context(train=True):
+        indexer.encode_batch(["a", "b", "c"])
+    output = indexer.encode_batch(["c", "a", "b", "a"])
+    assert output.dtype == numpy.int_
+    assert output.tolist() == [2, 0, 1, 0]
+
+    with pytest.raises(KeyError):
+        indexer.encode_batch(["a", "d"])
+
+
+def test_label_indexer_can_encode_multi_hot() -> None:
+    indexer = LabelIndexer[str]()
+    with indexer.context(train=True):
+        indexer.encode_batch(list("abcdefghij"))
+    label_sets = [["a", "c"], [], ["j", "b", "i"]]
+
+    output = indexer.encode_multi_hot(label_sets)
+    assert output.shape == (3, 10)
+    assert output.dtype == bool
+    assert output.sum(1).tolist() == [2, 0, 3]
+    assert indexer.decode_multi_hot(output) == [["a", "c"], [], ["b", "i", "j"]]
+
+    packed = indexer.encode_multi_hot(label_sets, packed=True)
+    assert packed.shape == (3, 2)
+    assert packed.dtype == numpy.uint8
+    assert indexer.decode_multi_hot(packed, packed=True) == [
+        ["a", "c"],
+        [],
+        ["b", "i", "j"],
+    ]
+
+    assert indexer.decode_multi_hot(indexer.encode_multi_hot([])) == []
+    empty = indexer.encode_multi_hot([], packed=True)
+    assert indexer.decode_multi_hot(empty, packed=True) == []
+
+
+def test_indexer_can_choose_index_dtype() -> None:
+    token_indexer = TokenIndexer[str](specials=["<pad>"], dtype="auto")
+    with token_indexer.context(train=True):
+        assert token_indexer.dtype == numpy.int64
+        token_indexer([str(i) for i in range(200)])
+    assert token_indexer.dtype == numpy.int16
+    assert token_indexer(["1", "2"])["token_ids"].dtype == numpy.int16
+    batch = token_indexer.encode_batch([["1", "2"], ["3"]])
+    assert batch["token_ids"].dtype == numpy.int16
+
+    label_indexer = LabelIndexer[str](dtype=numpy.int8)
+    with label_indexer.context(train=True):
+        label_indexer("a")
+    assert label_indexer.encode_batch(["a", "a"]).dtype == numpy.int8
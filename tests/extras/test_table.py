@@ -0,0 +1,92 @@
+from pathlib import Path
+
+import numpy
+
+from collatable import (
+    Collator,
+    LabelField,
+    MemmapTensorField,
+    MetadataField,
+    TensorField,
+    TextField,
+    collate,
+)
+from collatable.extras import DataLoader, DefaultBatchSampler, InstanceTable
+from collatable.extras.dataloader import BatchIterator
+
+
+def test_instance_table() -> None:
+    vocab = {"<pad>": 0, "a": 1, "b": 2, "c": 3}
+    labels = {"neg": 0, "pos": 1}
+    instances = [
+        {
+            "text": TextField(list(tokens), vocab=vocab),
+            "label": LabelField(label, vocab=labels),
+            "features": TensorField(
+                numpy.full((len(tokens), 2), float(i)), padding_value=-1
+            ),
+            "metadata": MetadataField({"id": i}),
+        }
+        for i, (tokens, label) in enumerate(
+            [("abc", "pos"), ("a", "neg"), ("cb", "pos"), ("bbbb", "neg")]
+        )
+    ]
+
+    table = InstanceTable.from_instances(instances)
+    assert len(table) == 4
+    assert table.nbytes > 0
+
+    instance = table[2]
+    assert instance["text"]["token_ids"].tolist() == [3, 2]
+    assert instance["label"] == 1
+    assert instance["features"].shape == (2, 2)
+    assert instance["metadata"] == instances[2]["metadata"]
+
+    indices = [3, 0, 1]
+    output = table.collate(indices)
+    expected = collate([instances[i] for i in indices])
+    assert output.keys() == expected.keys()
+    assert output["metadata"] == expected["metadata"]
+    for key in ("label", "features"):
+        numpy.testing.assert_array_equal(output[key], expected[key])
+    assert isinstance(output["text"], dict)
+    assert isinstance(expected["text"], dict)
+    for key in ("token_ids", "mask"):
+        numpy.testing.assert_array_equal(output["text"][key], expected["text"][key])
+
+    dataloader = DataLoader(DefaultBatchSampler(batch_size=3))
+    batches = list(dataloader(table))
+    assert [len(batch["label"]) for batch in batches] == [3, 1]
+
+
+def test_instance_table_keeps_custom_collate_and_collator(tmp_path: Path) -> None:
+    vocab = {"<pad>": 0, "a": 1, "b": 2}
+    instances = []
+    for index, tokens in enumerate(["ab", "a"]):
+        path = tmp_path / f"{index}.npy"
+        numpy.save(path, numpy.full((index + 1,), float(index)))
+        instances.append(
+            {
+                "text": TextField(list(tokens), vocab=vocab),
+                "label": LabelField(index),
+                "features": MemmapTensorField.from_npy(path),
+            }
+        )
+    table = InstanceTable.from_instances(instances)
+    assert table[0]["features"] is instances[0]["features"]
+
+    collator = Collator(
+        {"text", "features"},
+        index_dtype="auto",
+        vocab_sizes={"text": len(vocab)},
+        pack_masks=True,
+    )
+    output = next(BatchIterator(table, [[0, 1]], 1, collator=collator))
+    expected = collator(instances)
+    assert output.keys() == expected.keys() == {"text", "features"}
+    numpy.testing.assert_array_equal(output["features"], expected["features"])
+    assert isinstance(output["text"], dict)
+    assert isinstance(expected["text"], dict)
+    for key in ("token_ids", "mask"):
+        assert output["text"][key].dtype == expected["text"][key].dtype
+        numpy.testing.assert_array_equal(output["text"][key], expected["text"][key])
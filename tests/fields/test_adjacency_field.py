@@ -1,4 +1,5 @@
 import numpy
+import pytest
 
 from collatable.collator import collate
 from collatable.extras.indexer import LabelIndexer, TokenIndexer
@@ -63,3 +64,62 @@ def test_adajacency_field() -> None:
 
     relation_counts = (output >= 0).sum(2).sum(1)
     assert relation_counts.tolist() == [2, 1]
+
+
+def test_adjacency_field_can_defer_indexing() -> None:
+    text = TextField(["a", "b", "c"], vocab={"a": 0, "b": 1, "c": 2})
+    label_vocab = {"x": 0, "y": 1}
+    field = AdjacencyField(
+        [(0, 1), (2, 0)],
+        text,
+        labels=["x", "y"],
+        indexer=label_vocab.__getitem__,
+        lazy=True,
+    )
+    assert field == AdjacencyField(
+        [(0, 1), (2, 0)], text, labels=["x", "y"], indexer=label_vocab.__getitem__
+    )
+    assert field.as_array().tolist() == [[-1, 0, -1], [-1, -1, -1], [1, -1, -1]]
+
+
+def test_adjacency_field_can_be_reconstructed_from_arrays() -> None:
+    label_indexer = LabelIndexer[str]()
+    with label_indexer.context(train=True):
+        label_indexer("x")
+        label_indexer("y")
+
+    texts = [
+        TextField(["a", "b", "c"], vocab={"a": 0, "b": 1, "c": 2}),
+        TextField(["a", "b"], vocab={"a": 0, "b": 1}),
+    ]
+    fields = [
+        AdjacencyField(
+            [(0, 1), (2, 0)], texts[0], labels=["x", "y"], indexer=label_indexer
+        ),
+        AdjacencyField([(1, 1)], texts[1], labels=["y"], indexer=label_indexer),
+    ]
+
+    for field, text in zip(fields, texts):
+        output = AdjacencyField.from_array(
+            field.as_array(), sequence_field=text, indexer=label_indexer
+        )
+        assert output == field
+        assert output.as_array().tolist() == field.as_array().tolist()
+
+    batch = fields[0].collate(fields)
+    outputs = AdjacencyField.from_batch_array(
+        batch, sequence_fields=texts, indexer=label_indexer
+    )
+    assert outputs == fields
+
+    batch[1] = -1
+    outputs = AdjacencyField.from_batch_array(
+        batch, sequence_fields=texts, indexer=label_indexer
+    )
+    assert outputs[0] == fields[0]
+    assert outputs[1].as_array().tolist() == [[-1, -1], [-1, -1]]
+
+    with pytest.raises(ValueError):
+        AdjacencyField.from_batch_array(
+            batch, sequence_fields=texts[::-1], indexer=label_indexer
+        )
@@ -0,0 +1,53 @@
+import gc
+
+import numpy
+import pytest
+
+from collatable.fields import ListField, MappingField, ScalarField, TensorField
+from collatable.fields.array_cache import ArrayCache, array_cache
+
+
+def test_array_cache_is_bounded() -> None:
+    cache = ArrayCache(maxsize=8)
+    first, second = ScalarField(0), ScalarField(1)
+    cache.put(first, first.as_array())
+    cache.put(second, second.as_array())
+    assert cache.get(first) is None
+    assert cache.get(second) == 1
+    assert cache.cache_info() == (1, 1, 8, 8)
+
+    del second
+    gc.collect()
+    assert cache.cache_info().currsize == 0
+
+
+def test_composite_fields_memoize_arrays() -> None:
+    array_cache.cache_clear()
+    field = ListField([ScalarField(value) for value in range(3)])
+    output = field.as_array()
+    assert field.as_array() is output
+    assert not output.flags.writeable
+
+    mapping = MappingField({"values": field})
+    assert mapping.as_array()["values"] is output
+    assert mapping.as_array() is mapping.as_array()
+
+    info = array_cache.cache_info()
+    assert info.hits == 4
+    assert info.currsize == output.nbytes
+
+    with pytest.raises(TypeError):
+        mapping.as_array()["values"] = output
+
+
+def test_composite_fields_do_not_freeze_borrowed_arrays() -> None:
+    array_cache.cache_clear()
+    tensor = numpy.arange(4)
+    mapping = MappingField({"x": TensorField(tensor)})
+    assert mapping.as_array()["x"] is tensor
+    assert tensor.flags.writeable
+    assert array_cache.cache_info().currsize == 0
+
+    field = ListField([TensorField(tensor)])
+    assert not field.as_array().flags.writeable
+    assert tensor.flags.writeable
@@ -0,0 +1,59 @@
+import numpy
+
+from collatable.fields.enumerated_spans_field import EnumeratedSpansField
+from collatable.fields.list_field import ListField
+from collatable.fields.span_field import SpanField
+from collatable.fields.text_field import TextField
+
+
+def test_enumerated_spans_field_matches_span_fields() -> None:
+    vocab = {token: index for index, token in enumerate("abcde")}
+    for length in range(1, 6):
+        text = TextField(list("abcde"[:length]), vocab=vocab)
+        field = EnumeratedSpansField(text, max_width=3)
+        expected = ListField(
+            [
+                SpanField(start, end, text)
+                for end in range(1, length + 1)
+                for start in range(max(0, end - 3), end)
+            ]
+        )
+        output = field.as_array()
+        assert len(field) == len(expected)
+        numpy.testing.assert_array_equal(output["spans"], expected.as_array())
+        assert output["mask"].all()
+
+
+def test_enumerated_spans_field_can_be_collated_with_labels() -> None:
+    vocab = {token: index for index, token in enumerate("abcd")}
+    label_vocab = {"O": 0, "PER": 1, "LOC": 2}
+    short = TextField(list("ab"), vocab=vocab)
+    long = TextField(list("abcd"), vocab=vocab)
+    fields = [
+        EnumeratedSpansField(
+            short, 2, labels={(0, 2): "PER"}, vocab=label_vocab, null_label="O"
+        ),
+        EnumeratedSpansField(
+            long,
+            2,
+            labels={(1, 2): "LOC", (2, 4): "PER"},
+            vocab=label_vocab,
+            null_label="O",
+        ),
+    ]
+    output = fields[0].collate(fields)
+    assert output["spans"].shape == (2, 7, 2)
+    assert output["mask"].sum(axis=1).tolist() == [3, 7]
+    assert output["spans"][0].tolist() == [[0, 1], [0, 2], [1, 2]] + [[-1, -1]] * 4
+    assert output["labels"].tolist() == [
+        [0, 1, 0, -1, -1, -1, -1],
+        [0, 0, 2, 0, 0, 1, 0],
+    ]
+
+    field = EnumeratedSpansField.from_array(
+        {key: value[1] for key, value in output.items()},
+        sequence_field=long,
+        max_width=2,
+        indexer=None,
+    )
+    assert field.labels == {(1, 2): 2, (2, 4): 1}
@@ -0,0 +1,125 @@
+import pickle
+from typing import Any, Sequence, Tuple, Type
+
+import numpy
+import pytest
+
+from collatable.collator import collate
+from collatable.fields import (
+    AdjacencyField,
+    Field,
+    IndexField,
+    LabelField,
+    ListField,
+    MappingField,
+    MetadataField,
+    ScalarField,
+    SequenceLabelField,
+    SpanField,
+    TensorField,
+    TextField,
+)
+
+
+def _new_field(cls: Type[Field]) -> Field:
+    return cls.__new__(cls)
+
+
+# pickles a field the way older versions did, i.e. with fewer slots
+class _BaselinePickle:
+    def __init__(self, field: Field, slots: Sequence[str]) -> None:
+        self._field = field
+        self._slots = slots
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        dict_state, slots = self._field.__getstate__()
+        state = {key: value for key, value in slots.items() if key in self._slots}
+        return _new_field, (type(self._field),), (dict_state, state)
+
+
+def test_field_copy_shares_arrays_and_copies_fields() -> None:
+    tensor = numpy.zeros((2, 3))
+    tensors = ListField[numpy.ndarray](
+        [TensorField(tensor), TensorField(numpy.ones(2))]
+    )
+    metadata = MetadataField({"tags": ["x"]})
+    field = MappingField({"tensors": tensors, "metadata": metadata})
+
+    copied = field.copy()
+    assert copied == field
+    assert copied is not field
+
+    copied_tensors = copied["tensors"]
+    assert isinstance(copied_tensors, ListField)
+    assert copied_tensors is not tensors
+    assert copied_tensors[0] is not tensors[0]
+    copied_metadata = copied["metadata"]
+    assert isinstance(copied_metadata, MetadataField)
+    assert copied_metadata.as_array() == metadata.as_array()
+    assert copied_metadata.as_array() is not metadata.as_array()
+
+    copied_tensor = copied_tensors[0].as_array()
+    assert copied_tensor is tensor
+    assert not tensor.flags.writeable
+    with pytest.raises(ValueError):
+        copied_tensor[0, 0] = 1.0
+
+    deep_copied = field.copy(deep=True)
+    assert deep_copied == field
+    deep_copied_tensors = deep_copied["tensors"]
+    assert isinstance(deep_copied_tensors, ListField)
+    assert deep_copied_tensors[0].as_array() is not tensor
+
+
+def test_fields_load_pickles_without_newer_slots() -> None:
+    vocab = {"a": 0, "b": 1}
+    text = TextField(["a", "b"], vocab=vocab)
+    instance = {
+        "text": _BaselinePickle(text, ["_tokens", "_padding_value", "_indexed_tokens"]),
+        "label": _BaselinePickle(
+            LabelField("b", vocab=vocab), ["_label", "_label_index"]
+        ),
+        "tags": _BaselinePickle(
+            SequenceLabelField(["a", "b"], text, vocab=vocab),
+            ["_labels", "_indexed_labels"],
+        ),
+        "edges": _BaselinePickle(
+            AdjacencyField([(0, 1)], text),
+            [
+                "_indices",
+                "_labels",
+                "_indexed_labels",
+                "_sequence_length",
+                "_padding_value",
+            ],
+        ),
+        "index": _BaselinePickle(IndexField(1, text), ["_index"]),
+        "span": _BaselinePickle(
+            SpanField(0, 2, text), ["_span_start", "_span_end", "_padding_value"]
+        ),
+        "values": _BaselinePickle(
+            ListField([ScalarField(1), ScalarField(2)]), ["_fields", "_padding_value"]
+        ),
+    }
+    restored = pickle.loads(pickle.dumps(instance))
+    output = collate([restored, restored])
+
+    text_array = output.pop("text")
+    arrays = {
+        key: value.tolist()
+        for key, value in output.items()
+        if isinstance(value, numpy.ndarray)
+    }
+
+    assert restored["text"].tokens == ["a", "b"]
+    assert isinstance(text_array, dict)
+    assert text_array["token_ids"].tolist() == [[0, 1], [0, 1]]
+    assert text_array["mask"].all()
+    assert arrays == {
+        "label": [1, 1],
+        "tags": [[0, 1], [0, 1]],
+        "edges": [[[-1, 1], [-1, -1]], [[-1, 1], [-1, -1]]],
+        "index": [1, 1],
+        "span": [[0, 2], [0, 2]],
+        "values": [[1, 2], [1, 2]],
+    }
@@ -12,6 +12,14 @@ def test_index_field_can_be_converted_to_array() -> None:
     assert output == 2
 
 
+def test_index_field_can_be_collated() -> None:
+    vocab = {"a": 0, "is": 1, "test": 2, "this": 3}
+    text = TextField(["this", "is", "a", "test"], vocab=vocab)
+    fields = [IndexField(index, text) for index in (3, 0, 1)]
+    output = fields[0].collate(fields)
+    assert output.tolist() == [3, 0, 1]
+
+
 def test_index_field_can_raise_value_error() -> None:
     vocab = {"a": 0, "is": 1, "test": 2, "this": 3}
     text = TextField(["this", "is", "a", "test"], vocab=vocab)
@@ -19,3 +27,12 @@ def test_index_field_can_raise_value_error() -> None:
         ValueError, match="Index 4 is out of range for sequence of length 4"
     ):
         IndexField(4, text)
+
+
+def test_index_field_follows_sequence_truncation() -> None:
+    vocab = {"a": 0, "is": 1, "test": 2, "this": 3}
+    text = TextField(
+        ["this", "is", "a", "test"], vocab=vocab, max_length=2, truncation="tail"
+    )
+    fields = [IndexField(index, text) for index in range(4)]
+    assert fields[0].collate(fields).tolist() == [-1, -1, 0, 1]
@@ -1,3 +1,7 @@
+import numpy
+import pytest
+
+from collatable.extras.indexer import LabelIndexer
 from collatable.fields.label_field import LabelField
 
 
@@ -12,3 +16,37 @@ def test_label_field_can_be_converted_to_array_with_indexer() -> None:
     field = LabelField("b", vocab=vocab)
     output = field.as_array()
     assert output == 1
+
+
+def test_label_field_can_defer_indexing() -> None:
+    vocab = {"a": 0, "b": 1, "c": 2}
+    field = LabelField("b", indexer=vocab.__getitem__, lazy=True)
+    assert field == LabelField("b", indexer=vocab.__getitem__)
+    assert field.as_array() == 1
+
+
+def test_label_field_can_be_collated() -> None:
+    vocab = {"a": 0, "b": 1, "c": 2}
+    fields = [
+        LabelField("c", vocab=vocab),
+        LabelField("a", indexer=vocab.__getitem__, lazy=True),
+        LabelField(1),
+    ]
+    output = fields[0].collate(fields)
+    assert output.tolist() == [2, 0, 1]
+    assert output.dtype == numpy.int_
+    assert fields[0].collate([field.as_array() for field in fields]).tolist() == [
+        2,
+        0,
+        1,
+    ]
+
+
+def test_label_field_rejects_lazy_indexing_while_training() -> None:
+    indexer = LabelIndexer[str]()
+    with indexer.context(train=True):
+        with pytest.raises(ValueError):
+            LabelField("a", indexer=indexer, lazy=True)
+        indexer("a")
+    field = LabelField("a", indexer=indexer, lazy=True)
+    assert field.as_array() == 0
@@ -2,7 +2,9 @@ import numpy
 
 from collatable.fields.list_field import ListField
 from collatable.fields.scalar_field import ScalarField
+from collatable.fields.sparse_adjacency_field import SparseAdjacencyField
 from collatable.fields.tensor_field import TensorField
+from collatable.fields.text_field import TextField
 
 
 def test_list_field_can_convert_scalara_fields_to_array() -> None:
@@ -50,3 +52,54 @@ def test_list_field_with_scalar_fields() -> None:
     assert output.shape == (2, 5)
     assert output[0].tolist() == [0, 1, 2, 0, 0]
     assert output[1].tolist() == [0, 1, 2, 3, 4]
+
+
+def test_list_field_can_collate_text_fields_into_single_batch() -> None:
+    vocab = {"<pad>": 0, "a": 1, "b": 2, "c": 3}
+    fields = [
+        ListField(
+            [TextField(["a", "b", "c"], vocab=vocab), TextField(["a"], vocab=vocab)]
+        ),
+        ListField([TextField(["b", "b"], vocab=vocab)]),
+    ]
+    output = fields[0].collate(fields)
+    assert isinstance(output, dict)
+    assert output["token_ids"].tolist() == [
+        [[1, 2, 3], [1, 0, 0]],
+        [[2, 2, 0], [0, 0, 0]],
+    ]
+    assert output["mask"].tolist() == [
+        [[True, True, True], [True, False, False]],
+        [[True, True, False], [False, False, False]],
+    ]
+    for index, field in enumerate(fields):
+        array = field.as_array()
+        assert isinstance(array, dict)
+        length = len(field)
+        numpy.testing.assert_array_equal(
+            array["token_ids"],
+            output["token_ids"][index, :length, : array["token_ids"].shape[1]],
+        )
+
+
+def test_list_field_truncates_to_max_length() -> None:
+    field = ListField(
+        [ScalarField(value) for value in range(5)], max_length=3, truncation="tail"
+    )
+    assert len(field) == 5
+    assert field.as_array().tolist() == [2, 3, 4]
+
+    nested = ListField([field, ListField([ScalarField(7)])])
+    assert nested.as_array().tolist() == [[2, 3, 4], [7, 0, 0]]
+
+
+def test_list_field_keeps_custom_collate_of_items() -> None:
+    text = TextField(["a", "b", "c"], vocab={"a": 0, "b": 1, "c": 2})
+    graphs = [
+        SparseAdjacencyField([(0, 1), (2, 0)], text),
+        SparseAdjacencyField([(1, 2)], text),
+    ]
+    output = ListField(graphs).as_array()
+    assert isinstance(output, dict)
+    assert output["edge_index"].tolist() == [[0, 2, 4], [1, 0, 5]]
+    assert output["ptr"].tolist() == [0, 3, 6]
@@ -127,3 +127,30 @@ def test_mapping_field_can_be_collated() -> None:
     assert isinstance(reconstruction[1]["label"], LabelField)
     assert reconstruction[0]["label"].label == "positive"
     assert reconstruction[1]["label"].label == "negative"
+
+
+def test_mapping_field_can_collate_nested_mapping_fields() -> None:
+    vocab = {"<pad>": 0, "a": 1, "b": 2}
+    labels = {"negative": 0, "positive": 1}
+    fields = [
+        MappingField(
+            {
+                "inputs": MappingField({"text": TextField(["a", "b"], vocab=vocab)}),
+                "label": LabelField("positive", vocab=labels),
+            }
+        ),
+        MappingField(
+            {
+                "inputs": MappingField({"text": TextField(["b"], vocab=vocab)}),
+                "label": LabelField("negative", vocab=labels),
+            }
+        ),
+    ]
+
+    items = list(fields[0].iter_collate(fields))
+    assert [key for key, _ in items] == ["inputs", "label"]
+
+    output = fields[0].collate(fields)
+    assert output["inputs"]["text"]["token_ids"].tolist() == [[1, 2], [2, 0]]
+    assert output["inputs"]["text"]["mask"].tolist() == [[True, True], [True, False]]
+    assert output["label"].tolist() == [1, 0]
@@ -0,0 +1,47 @@
+import pickle
+from pathlib import Path
+
+import numpy
+import pytest
+
+from collatable.fields.memmap_tensor_field import MemmapTensorField
+from collatable.fields.tensor_field import TensorField
+
+
+def test_memmap_tensor_field_can_be_collated(tmp_path: Path) -> None:
+    tensors = [
+        numpy.arange(6, dtype=numpy.float32).reshape(2, 3),
+        numpy.arange(4, dtype=numpy.float32).reshape(4, 1),
+    ]
+    fields = []
+    for index, tensor in enumerate(tensors):
+        path = tmp_path / f"{index}.npy"
+        numpy.save(path, tensor)
+        fields.append(MemmapTensorField.from_npy(path, padding_value=-1))
+
+    assert fields[0].shape == (2, 3)
+    numpy.testing.assert_array_equal(fields[0].as_array(), tensors[0])
+
+    output = fields[0].collate(fields)
+    expected = TensorField(tensors[0], padding_value=-1).collate(
+        [TensorField(tensor, padding_value=-1) for tensor in tensors]
+    )
+    assert output.dtype == numpy.float32
+    numpy.testing.assert_array_equal(output, expected)
+
+    restored = pickle.loads(pickle.dumps(fields[1]))
+    assert restored == fields[1]
+
+
+def test_memmap_tensor_field_can_reference_raw_file(tmp_path: Path) -> None:
+    path = tmp_path / "features.bin"
+    data = numpy.arange(12, dtype=numpy.int16)
+    data.tofile(path)
+
+    field = MemmapTensorField(path, (2, 2), numpy.int16, offset=4 * data.itemsize)
+    assert field.as_array().tolist() == [[4, 5], [6, 7]]
+
+    memmap = numpy.memmap(path, dtype=numpy.int16, mode="r", shape=(3, 4))
+    assert MemmapTensorField.from_array(memmap).as_array().tolist() == memmap.tolist()
+    with pytest.raises(ValueError):
+        MemmapTensorField.from_array(memmap[1:])
@@ -0,0 +1,52 @@
+import numpy
+import pytest
+
+from collatable.extras.indexer import LabelIndexer
+from collatable.fields.multi_label_field import MultiLabelField
+
+
+def test_multi_label_field_can_be_converted_to_array() -> None:
+    vocab = {"a": 0, "b": 1, "c": 2}
+    field = MultiLabelField(["a", "c"], vocab=vocab)
+    output = field.as_array()
+    assert output.tolist() == [True, False, True]
+
+
+def test_multi_label_field_requires_num_labels() -> None:
+    with pytest.raises(ValueError):
+        MultiLabelField([0, 1])
+    with pytest.raises(ValueError):
+        MultiLabelField([0, 3], num_labels=3)
+
+
+def test_multi_label_field_can_be_collated() -> None:
+    indexer = LabelIndexer[str]()
+    with indexer.context(train=True):
+        for label in ("a", "b", "c"):
+            indexer(label)
+        with pytest.raises(ValueError):
+            MultiLabelField(["a"], indexer=indexer)
+
+    fields = [
+        MultiLabelField(["a", "b"], indexer=indexer),
+        MultiLabelField([], indexer=indexer),
+        MultiLabelField(["c", "a"], indexer=indexer),
+    ]
+
+    output = fields[0].collate(fields)
+    assert isinstance(output, numpy.ndarray)
+    assert output.shape == (3, 3)
+    assert output.tolist() == [
+        [True, True, False],
+        [False, False, False],
+        [True, False, True],
+    ]
+    numpy.testing.assert_array_equal(
+        output, indexer.encode_multi_hot([["a", "b"], [], ["c", "a"]])
+    )
+
+    reconstruction = MultiLabelField.from_array(output[2], indexer=indexer)
+    assert reconstruction.labels == ["a", "c"]
+
+    with pytest.raises(ValueError):
+        fields[0].collate([fields[0], MultiLabelField(["a"], vocab={"a": 0, "b": 1})])
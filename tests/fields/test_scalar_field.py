@@ -9,3 +9,10 @@ def test_scalar_field() -> None:
     assert isinstance(output, numpy.ndarray)
     assert output.shape == (5,)  # type: ignore[comparison-overlap]
     assert output.tolist() == [0, 1, 2, 3, 4]
+
+
+def test_scalar_field_collation_promotes_dtype() -> None:
+    fields = [ScalarField(1), ScalarField(2.5)]
+    output = fields[0].collate(fields)
+    assert output.dtype == numpy.float64
+    assert output.tolist() == [1.0, 2.5]
@@ -29,3 +29,43 @@ def test_sequence_label_field() -> None:
     assert output.shape == (2, 7)
     assert output[0].tolist() == [0, 0, 0, 1, 2, 0, 0]
     assert output[1].tolist() == [0, 0, 0, 3, 0, 0, 0]
+
+
+def test_sequence_label_field_can_defer_indexing() -> None:
+    label_vocab = {"O": 0, "B": 1, "I": 2}
+    text_field = TextField(["john", "smith"], vocab={"john": 0, "smith": 1})
+    field = SequenceLabelField(
+        ["B", "I"], text_field, indexer=label_vocab.__getitem__, lazy=True
+    )
+    assert field._indexed_labels is None
+    assert field.as_array().tolist() == [1, 2]
+
+
+def test_sequence_label_field_inherits_truncation() -> None:
+    text = TextField(
+        ["my", "name", "is", "john"],
+        vocab={},
+        lazy=True,
+        max_length=3,
+        truncation="tail",
+    )
+    field = SequenceLabelField(
+        ["O", "O", "B", "I"], text, vocab={"O": 0, "B": 1, "I": 2}
+    )
+    assert field.max_length == 3
+    assert field.as_array().tolist() == [0, 1, 2]
+
+
+def test_sequence_label_field_truncation_follows_special_tokens() -> None:
+    tokens = ["my", "name", "is", "john", "smith", "jr", "."]
+    token_indexer = TokenIndexer(specials=["<s>", "</s>"], bos="<s>", eos="</s>")
+    with token_indexer.context(train=True):
+        text = TextField(tokens, indexer=token_indexer, max_length=6)
+    field = SequenceLabelField(
+        ["O", "O", "O", "B", "I", "I", "O"],
+        text,
+        vocab={"O": 0, "B": 1, "I": 2},
+    )
+    assert len(text.as_array()["token_ids"]) == 6
+    assert field.as_array().tolist() == [0, 0, 0, 1]
+    assert len(field.as_array()) == text.get_truncated_position(len(text))
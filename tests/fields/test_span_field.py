@@ -31,3 +31,12 @@ def test_span_field() -> None:
 
     span_lengths = (output.max(2) >= 0).sum(1)
     assert span_lengths.tolist() == [3, 2]
+
+
+def test_span_field_follows_sequence_truncation() -> None:
+    vocab = {token: index for index, token in enumerate("abcdefg")}
+    text = TextField(list("abcdefg"), vocab=vocab, max_length=4, truncation="middle")
+    spans = ListField(
+        [SpanField(0, 3, text), SpanField(2, 4, text), SpanField(4, 7, text)]
+    )
+    assert spans.as_array().tolist() == [[0, 2], [-1, -1], [2, 4]]
@@ -0,0 +1,54 @@
+import numpy
+
+from collatable.collator import collate
+from collatable.fields.adjacency_field import AdjacencyField
+from collatable.fields.sparse_adjacency_field import SparseAdjacencyField
+from collatable.fields.text_field import TextField
+
+
+def test_sparse_adjacency_field() -> None:
+    label_vocab = {"x": 0, "y": 1}
+    first = TextField(["a", "b", "c"], vocab={"a": 0, "b": 1, "c": 2})
+    second = TextField(["a", "b"], vocab={"a": 0, "b": 1})
+    instances = [
+        {
+            "graph": SparseAdjacencyField(
+                [(0, 1), (2, 0)], first, labels=["x", "y"], vocab=label_vocab
+            )
+        },
+        {"graph": SparseAdjacencyField([], first)},
+        {"graph": SparseAdjacencyField([(1, 0)], second, labels=[1])},
+    ]
+
+    output = collate(instances)["graph"]
+    assert isinstance(output, dict)
+    assert output["edge_index"].tolist() == [[0, 2, 7], [1, 0, 6]]
+    assert output["edge_labels"].tolist() == [0, 1, 1]
+    assert output["batch"].tolist() == [0, 0, 0, 1, 1, 1, 2, 2]
+    assert output["ptr"].tolist() == [0, 3, 6, 8]
+
+    arrays = [instance["graph"].as_array() for instance in instances]
+    from_arrays = instances[0]["graph"].collate(arrays)
+    for key in output:
+        numpy.testing.assert_array_equal(from_arrays[key], output[key])
+
+    unbatched = SparseAdjacencyField.unbatch(output)
+    assert len(unbatched) == 3
+    for array, expected in zip(unbatched, arrays):
+        for key in expected:
+            numpy.testing.assert_array_equal(array[key], expected[key])
+
+    field = SparseAdjacencyField.from_array(unbatched[2], sequence_field=second)
+    assert field == instances[2]["graph"]
+
+
+def test_sparse_adjacency_field_matches_dense_field() -> None:
+    text = TextField(["a", "b", "c"], vocab={"a": 0, "b": 1, "c": 2})
+    indices = [(0, 1), (2, 0), (1, 1)]
+    labels = ["p", "q", "r"]
+    vocab = {"p": 3, "q": 4, "r": 5}
+    dense = AdjacencyField(indices, text, labels=labels, vocab=vocab).as_array()
+    sparse = SparseAdjacencyField(indices, text, labels=labels, vocab=vocab).as_array()
+    edge_index = sparse["edge_index"]
+    assert dense[edge_index[0], edge_index[1]].tolist() == [3, 4, 5]
+    assert (dense >= 0).sum() == len(indices)
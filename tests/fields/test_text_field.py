@@ -1,5 +1,9 @@
-from typing import List
+import pickle
+from typing import List, Mapping, Sequence
 
+import numpy
+
+from collatable.extras.indexer import TokenIndexer
 from collatable.fields.text_field import PaddingValue, TextField
 
 
@@ -34,3 +38,143 @@ def test_text_field_can_be_collated() -> None:
     assert output.keys() == {"token_ids", "mask"}
     assert output["token_ids"].tolist() == [[3, 2, 0, 1, 5, -1], [3, 2, 0, 4, 5, 6]]
     assert output["mask"].sum(1).tolist() == [5, 6]
+
+
+def test_text_field_can_defer_indexing() -> None:
+    vocab = {"a": 0, "is": 1, "test": 2, "this": 3}
+    calls: List[Sequence[str]] = []
+
+    def indexer(tokens: Sequence[str]) -> Mapping[str, numpy.ndarray]:
+        calls.append(tokens)
+        return {
+            "token_ids": numpy.array([vocab[token] for token in tokens]),
+            "mask": numpy.ones(len(tokens), dtype=bool),
+        }
+
+    fields = [
+        TextField(["this", "is", "a", "test"], indexer=indexer, lazy=True),
+        TextField(["this", "is"], indexer=indexer, lazy=True),
+    ]
+    assert len(fields[0]) == 4
+    assert calls == []
+
+    output = fields[0].collate(fields)
+    assert output["token_ids"].tolist() == [[3, 1, 0, 2], [3, 1, 0, 0]]
+    assert len(calls) == 2
+
+    fields[0].as_array()
+    assert len(calls) == 2
+
+    restored = pickle.loads(pickle.dumps(TextField(["a"], indexer=indexer, lazy=True)))
+    assert restored.as_array()["token_ids"].tolist() == [0]
+    assert len(calls) == 3
+
+
+def test_text_field_can_cast_token_ids() -> None:
+    vocab = {"a": 0, "b": 1}
+    field = TextField(["a", "b"], vocab=vocab, dtype=numpy.int16)
+    assert field.as_array()["token_ids"].dtype == numpy.int16
+    field = TextField(["a", "b"], vocab=vocab, lazy=True, dtype="int8")
+    assert field.as_array()["token_ids"].dtype == numpy.int8
+
+
+def test_text_field_can_derive_mask_at_collate_time() -> None:
+    vocab = {"<pad>": 0, "a": 1, "b": 2}
+    fields = [
+        TextField(["a", "b", "a"], vocab=vocab, store_mask=False),
+        TextField(["b"], vocab=vocab, store_mask=False),
+    ]
+    assert fields[0].as_array()["mask"].tolist() == [True, True, True]
+
+    output = fields[0].collate(fields)
+    assert output["token_ids"].tolist() == [[1, 2, 1], [2, 0, 0]]
+    assert output["mask"].tolist() == [[True, True, True], [True, False, False]]
+
+    expected = fields[0].collate(
+        [TextField(field.tokens, vocab=vocab) for field in fields]
+    )
+    for key in ("token_ids", "mask"):
+        numpy.testing.assert_array_equal(output[key], expected[key])
+
+    restored = pickle.loads(pickle.dumps(fields[1]))
+    assert restored == fields[1]
+
+
+def test_text_field_can_be_created_from_ids() -> None:
+    vocab = {"<pad>": 0, "a": 1, "b": 2}
+    token_ids = numpy.array([1, 2, 1])
+    field = TextField[str].from_ids(token_ids, padding_value=0)
+    assert len(field) == 3
+    assert field.as_array()["token_ids"] is token_ids
+    assert field.as_array()["mask"].tolist() == [True, True, True]
+
+    class Decoder:
+        def __call__(self, tokens: Sequence[str]) -> Mapping[str, numpy.ndarray]:
+            raise NotImplementedError
+
+        def decode(self, index: Mapping[str, numpy.ndarray]) -> Sequence[str]:
+            inverse = {index: token for token, index in vocab.items()}
+            return [inverse[token_id] for token_id in index["token_ids"].tolist()]
+
+    mask = numpy.array([True, True])
+    decoded = TextField.from_ids(numpy.array([2, 1]), mask=mask, indexer=Decoder())
+    assert list(decoded) == ["b", "a"]
+    assert decoded.as_array()["mask"] is mask
+
+    output = field.collate([field, TextField(["b"], vocab=vocab)])
+    assert output["token_ids"].tolist() == [[1, 2, 1], [2, 0, 0]]
+    assert output["mask"].tolist() == [[True, True, True], [True, False, False]]
+
+
+def test_text_field_truncates_to_max_length() -> None:
+    vocab = {token: index for index, token in enumerate("abcdefg")}
+    tokens = list("abcdefg")
+    head = TextField(tokens, vocab=vocab, max_length=4)
+    tail = TextField(tokens, vocab=vocab, max_length=4, truncation="tail")
+    middle = TextField(tokens, vocab=vocab, max_length=4, truncation="middle")
+    assert len(head) == 7
+    assert head.as_array()["token_ids"].tolist() == [0, 1, 2, 3]
+    assert tail.as_array()["token_ids"].tolist() == [3, 4, 5, 6]
+    assert middle.as_array()["token_ids"].tolist() == [0, 1, 5, 6]
+
+    short = TextField(list("ab"), vocab=vocab, max_length=4, store_mask=False)
+    long = TextField(tokens, vocab=vocab, max_length=4, store_mask=False)
+    output = short.collate([short, long])
+    assert output["token_ids"].shape == (2, 4)
+    assert output["mask"].tolist() == [[True, True, False, False], [True] * 4]
+
+
+def test_text_field_truncation_keeps_special_tokens() -> None:
+    indexer = TokenIndexer[str](
+        specials=("<pad>", "<s>", "</s>"), bos="<s>", eos="</s>"
+    )
+    with indexer.context(train=True):
+        fields = [
+            TextField(list("abcde"), indexer=indexer, max_length=5),
+            TextField(
+                list("abcdef"), indexer=indexer, max_length=5, truncation="middle"
+            ),
+        ]
+    output = fields[0].collate(fields)
+    assert output["token_ids"].shape == (2, 5)
+    assert [indexer.decode({"token_ids": ids}) for ids in output["token_ids"]] == [
+        ["<s>", "a", "b", "c", "</s>"],
+        ["<s>", "a", "b", "f", "</s>"],
+    ]
+    assert fields[1].get_truncated_position(5) == 2
+
+
+def test_text_field_from_ids_excludes_special_tokens() -> None:
+    indexer = TokenIndexer[str](
+        specials=("<pad>", "<s>", "</s>"), bos="<s>", eos="</s>"
+    )
+    with indexer.context(train=True):
+        field = TextField(list("abc"), indexer=indexer, max_length=4)
+    token_ids = indexer(list("abc"))["token_ids"]
+    rebuilt = TextField[str].from_ids(token_ids, indexer=indexer, max_length=4)
+    assert len(rebuilt) == len(field) == 3
+    assert rebuilt.tokens == ["a", "b", "c"]
+    assert rebuilt.get_truncated_position(3) == field.get_truncated_position(3) == 2
+    numpy.testing.assert_array_equal(
+        rebuilt.as_array()["token_ids"], field.as_array()["token_ids"]
+    )
@@ -1,10 +1,17 @@
 from typing import List
 
 import numpy
+import pytest
 
 from collatable.collator import Collator
 from collatable.extras.indexer import LabelIndexer, TokenIndexer
-from collatable.fields import LabelField, MetadataField, TextField
+from collatable.fields import (
+    LabelField,
+    MetadataField,
+    ScalarField,
+    TensorField,
+    TextField,
+)
 
 
 def test_instance() -> None:
@@ -38,3 +45,88 @@ def test_instance() -> None:
     assert isinstance(output["label"], numpy.ndarray)
     assert isinstance(output["metadata"], list)
     assert output["metadata"] == [{"id": 0}, {"id": 1}, {"id": 2}, {"id": 3}]
+
+
+def test_collator_can_narrow_indices_and_pack_masks() -> None:
+    vocab = {"<pad>": 0, "a": 1, "b": 2}
+    instances = [
+        {
+            "text": TextField(["a", "b", "a"], vocab=vocab),
+            "label": LabelField(1),
+            "flag": ScalarField(True),
+            "features": TensorField(numpy.array([True, False])),
+        },
+        {
+            "text": TextField(["b"], vocab=vocab),
+            "label": LabelField(0),
+            "flag": ScalarField(False),
+            "features": TensorField(numpy.array([False, True])),
+        },
+    ]
+    collator = Collator(
+        index_dtype="auto",
+        vocab_sizes={"text": len(vocab), "label": 300},
+        pack_masks=True,
+    )
+    output = collator(instances)
+    text = output["text"]
+    assert isinstance(text, dict)
+    assert text["token_ids"].dtype == numpy.int8
+    assert text["token_ids"].tolist() == [[1, 2, 1], [2, 0, 0]]
+    assert numpy.unpackbits(text["mask"], axis=-1, count=3).tolist() == [
+        [1, 1, 1],
+        [1, 0, 0],
+    ]
+    label = output["label"]
+    assert isinstance(label, numpy.ndarray)
+    assert label.dtype == numpy.int16
+    flag, features = output["flag"], output["features"]
+    assert isinstance(flag, numpy.ndarray)
+    assert isinstance(features, numpy.ndarray)
+    assert flag.tolist() == [True, False]
+    assert features.tolist() == [[True, False], [False, True]]
+
+    # the dtype follows the vocabulary size, not the ids of the batch
+    text = collator(instances[1:])["text"]
+    assert isinstance(text, dict)
+    assert text["token_ids"].dtype == numpy.int8
+    with pytest.raises(ValueError):
+        Collator(index_dtype="auto")
+
+    output = Collator(index_dtype=numpy.int32)(instances)
+    label = output["label"]
+    assert isinstance(label, numpy.ndarray)
+    assert label.dtype == numpy.int32
+
+
+def test_collator_casts_only_index_fields() -> None:
+    vocab = {str(index): index for index in range(300)}
+    instances = [
+        {
+            "text": TextField(["1", "2"], vocab=vocab),
+            "label": LabelField(3),
+            "scalar": ScalarField(1000),
+            "tensor": TensorField(numpy.array([200, 300])),
+        }
+    ]
+    output = Collator(index_dtype=numpy.int8)(instances)
+    text, label, scalar, tensor = (
+        output["text"],
+        output["label"],
+        output["scalar"],
+        output["tensor"],
+    )
+    assert isinstance(text, dict)
+    assert isinstance(label, numpy.ndarray)
+    assert isinstance(scalar, numpy.ndarray)
+    assert isinstance(tensor, numpy.ndarray)
+    assert text["token_ids"].dtype == numpy.int8
+    assert label.dtype == numpy.int8
+    assert scalar.tolist() == [1000]
+    assert tensor.tolist() == [[200, 300]]
+
+    instances = [{"text": TextField(["299"], vocab=vocab)}]
+    with pytest.raises(ValueError):
+        Collator(index_dtype=numpy.int8)(instances)
+    with pytest.raises(ValueError):
+        TextField(["299"], vocab=vocab, dtype=numpy.int8)